@@ -1,6 +1,8 @@
 from copy import deepcopy as _deepcopy
 from functools import singledispatch
+from typing import Any
 
+import dask
 from anndata import AnnData
 from dask.array.core import Array as DaskArray
 from dask.array.core import from_array
@@ -66,12 +68,17 @@ def _(element: DataTree) -> DataTree:
     # https://github.com/scverse/spatialdata/pull/587/files#diff-c74ebf49cb8cbddcfaec213defae041010f2043cfddbded24175025b6764ef79
     # to understand the original motivation.
     model = get_model(element)
+    dask_backed: dict[tuple[str, Any], DataArray] = {}
     for key in element:
         ds = element[key].ds
         assert len(ds) == 1
         variable = ds.__iter__().__next__()
         if isinstance(element[key][variable].data, DaskArray):
-            element[key][variable] = element[key][variable].compute()
+            dask_backed[key, variable] = element[key][variable]
+    # the scales are computed together: the downscaled levels are often derived from scale0 (e.g. right after parsing),
+    # so computing them one at a time would read and process the full resolution data once per level
+    for (key, variable), computed in zip(dask_backed, dask.compute(*dask_backed.values()), strict=True):
+        element[key][variable] = computed
     msi = element.copy(deep=True)
     for key in msi:
         ds = msi[key].ds
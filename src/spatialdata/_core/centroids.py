@@ -1,7 +1,8 @@
-from collections import defaultdict
 from functools import singledispatch
 
+import dask
 import dask.array as da
+import numpy as np
 import pandas as pd
 import xarray as xr
 from dask.dataframe import DataFrame as DaskDataFrame
@@ -10,6 +11,7 @@ from shapely import MultiPolygon, Point, Polygon
 from xarray import DataArray, DataTree
 
 from spatialdata._core.operations.transform import transform
+from spatialdata._types import ArrayLike
 from spatialdata.models import get_axes_names
 from spatialdata.models._utils import SpatialElement
 from spatialdata.models.models import Labels2DModel, Labels3DModel, PointsModel, get_model
@@ -54,40 +56,90 @@ def get_centroids(
     raise ValueError(f"The object type {type(e)} is not supported.")
 
 
-def _get_centroids_for_axis(xdata: xr.DataArray, axis: str) -> pd.DataFrame:
+def _get_centroids_sums_for_block(block: ArrayLike, coords: list[ArrayLike], axes: tuple[str, ...]) -> pd.DataFrame:
     """
-    Compute the component "axis" of the centroid of each label as a weighted average of the xarray coordinates.
+    Compute, for each label in a block, the number of pixels and the sum of their coordinates along each axis.
+
+    Parameters
+    ----------
+    block
+        A block of the labels.
+    coords
+        For each axis, the xarray coordinates of the block along that axis.
+    axes
+        The names of the axes.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame indexed by the label values in the block, with a column "count" with the number of pixels and one
+        column per axis with the sum of the coordinates of the pixels.
+    """
+    labels_values, inverse, counts = np.unique(block, return_inverse=True, return_counts=True)
+    inverse = inverse.ravel()
+    sums = {}
+    for i, (axis, axis_coords) in enumerate(zip(axes, coords, strict=True)):
+        shape = [1] * block.ndim
+        shape[i] = -1
+        weights = np.broadcast_to(np.reshape(axis_coords, shape), block.shape).ravel()
+        sums[axis] = np.bincount(inverse, weights=weights, minlength=len(labels_values))
+    return pd.DataFrame({"count": counts, **sums}, index=labels_values)
+
+
+def _get_centroids_sums_for_labels(xdata: xr.DataArray) -> pd.DataFrame:
+    """
+    Compute, for each label, the number of pixels and the sum of the xarray coordinates of its pixels along each axis.
+
+    The sums are computed block-wise (in a single pass over the data), and then combined across the blocks.
+
+    Parameters
+    ----------
+    xdata
+        The xarray DataArray containing the labels.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame with a column "count" with the number of pixels of each label and one column per axis with the sum
+        of the coordinates of its pixels. The index of the DataFrame is the collection of label values, sorted in
+        ascending order.
+    """
+    axes = tuple(str(axis) for axis in xdata.dims)
+    data = da.asarray(xdata.data)
+    offsets = [np.cumsum((0,) + chunks) for chunks in data.chunks]
+    axes_coords = [xdata[axis].values for axis in axes]
+    tasks = [
+        dask.delayed(_get_centroids_sums_for_block)(
+            block,
+            [
+                axis_coords[axis_offsets[i] : axis_offsets[i + 1]]
+                for axis_coords, axis_offsets, i in zip(axes_coords, offsets, index, strict=True)
+            ],
+            axes,
+        )
+        for index, block in zip(np.ndindex(*data.numblocks), data.to_delayed().ravel(), strict=True)
+    ]
+    return pd.concat(dask.compute(*tasks)).groupby(level=0).sum()
+
+
+def _get_centroids_for_labels(xdata: xr.DataArray) -> pd.DataFrame:
+    """
+    Compute the centroid of each label as the average of the xarray coordinates of its pixels.
 
     Parameters
     ----------
     xdata
         The xarray DataArray containing the labels.
-    axis
-        The axis for which the centroids are computed.
 
     Returns
     -------
     pd.DataFrame
-        A DataFrame containing one column, named after "axis", with the centroids of the labels along that axis.
-        The index of the DataFrame is the collection of label values, sorted in ascending order.
+        A DataFrame containing one column per axis, with the centroids of the labels along that axis. The index of the
+        DataFrame is the collection of label values, sorted in ascending order.
     """
-    centroids: dict[int, float] = defaultdict(float)
-    for i in xdata[axis]:
-        portion = xdata.sel(**{axis: i}).data
-        u = da.unique(portion, return_counts=True)
-        labels_values = u[0].compute()
-        counts = u[1].compute()
-        for j in range(len(labels_values)):
-            label_value = labels_values[j]
-            count = counts[j]
-            centroids[label_value] += count * i.values.item()
-
-    all_labels_values, all_labels_counts = da.unique(xdata.data, return_counts=True)
-    all_labels = dict(zip(all_labels_values.compute(), all_labels_counts.compute(), strict=True))
-    for label_value in centroids:
-        centroids[label_value] /= all_labels[label_value]
-    centroids = dict(sorted(centroids.items(), key=lambda x: x[0]))
-    return pd.DataFrame({axis: centroids.values()}, index=list(centroids.keys()))
+    sums = _get_centroids_sums_for_labels(xdata)
+    axes = [str(axis) for axis in xdata.dims]
+    return sums[axes].div(sums["count"], axis=0)
 
 
 @get_centroids.register(DataArray)
@@ -107,10 +159,7 @@ def _(
         assert len(e["scale0"]) == 1
         e = next(iter(e["scale0"].values()))
 
-    dfs = []
-    for axis in get_axes_names(e):
-        dfs.append(_get_centroids_for_axis(e, axis))
-    df = pd.concat(dfs, axis=1)
+    df = _get_centroids_for_labels(e)[list(get_axes_names(e))]
     if not return_background and 0 in df.index:
         df = df.drop(index=0)  # drop the background label
     t = get_transformation(e, coordinate_system)
@@ -226,13 +226,16 @@ def _create_sdata_from_table_and_shapes(
 
     shapes_index_dtype = shapes.index.dtype if isinstance(shapes, GeoDataFrame) else shapes.dtype
     try:
-        table.obs[instance_key] = table.obs_names.copy().astype(shapes_index_dtype)
+        # astype() already returns a new array, no need to copy the obs names beforehand
+        table.obs[instance_key] = table.obs_names.astype(shapes_index_dtype)
     except ValueError as err:
         raise TypeError(
             f"Instance key column dtype in table resulting from aggregation cannot be cast to the dtype of"
             f"element {shapes_name}.index"
         ) from err
-    table.obs[region_key] = pd.Categorical([shapes_name] * len(table))
+    # all the rows annotate the same element: build the categorical from its codes instead of from a list of len(table)
+    # strings that would need to be factorized
+    table.obs[region_key] = pd.Categorical.from_codes(np.zeros(len(table), dtype=np.int8), categories=[shapes_name])
     table = TableModel.parse(table, region=shapes_name, region_key=region_key, instance_key=instance_key)
 
     # labels case, needs conversion from str to int
@@ -448,37 +451,40 @@ def _aggregate_shapes(
         aggregated = joined.groupby([INDEX])[value_key].agg(agg_func).reset_index()
         aggregated_values = aggregated[value_key].values
 
-    # Here we prepare some variables to construct a sparse matrix in the coo format (edges + nodes)
     rows_categories = by.index.tolist()
-    indices_of_aggregated_rows = np.array(aggregated[INDEX])
-    # In the categorical case len(value_key) == 1 so np.repeat does nothing, in the non-categorical case len(value_key)
-    # can be > 1, so the aggregated table len(value_key) columns. This table will be flattened to a vector, so when
-    # constructing the sparse matrix we need to repeat each row index len(value_key) times.
-    # Example: the rows indices [0, 1, 2] in the case of len(value_key) == 2, will become [0, 0, 1, 1, 2, 2]
-    indices_of_aggregated_rows = np.repeat(indices_of_aggregated_rows, len(value_key))
-    rows_nodes = pd.Categorical(indices_of_aggregated_rows, categories=rows_categories, ordered=True)
+    rows_codes = pd.Categorical(aggregated[INDEX], categories=rows_categories, ordered=True).codes.astype(np.int64)
     if categorical:
+        # Here we prepare some variables to construct a sparse matrix in the coo format (edges + nodes)
         columns_categories = values[vk].cat.categories.tolist()
-        columns_nodes = pd.Categorical(aggregated[vk], categories=columns_categories, ordered=True)
+        columns_codes = pd.Categorical(aggregated[vk], categories=columns_categories, ordered=True).codes
+        X = sparse.coo_matrix(
+            (
+                aggregated_values.ravel(),
+                (rows_codes, columns_codes),
+            ),
+            shape=(len(rows_categories), len(columns_categories)),
+        ).tocsr()
     else:
+        # Each row of the aggregated table appears once and holds one value for each of the len(value_key) columns, so
+        # the sparse matrix is built directly in the csr format (no coo construction and conversion): the rows are
+        # sorted, each of them contributes len(value_key) entries, and the column indices are 0, ..., len(value_key) - 1
         columns_categories = value_key
-        numel = np.prod(aggregated_values.shape)
-        assert numel % len(columns_categories) == 0
-        columns_nodes = pd.Categorical(
-            columns_categories * (numel // len(columns_categories)), categories=columns_categories
+        n_columns = len(columns_categories)
+        order = np.argsort(rows_codes, kind="stable")
+        indptr = np.zeros(len(rows_categories) + 1, dtype=np.int64)
+        indptr[rows_codes + 1] = n_columns
+        X = sparse.csr_matrix(
+            (
+                aggregated_values[order].ravel(),
+                np.tile(np.arange(n_columns), len(order)),
+                np.cumsum(indptr),
+            ),
+            shape=(len(rows_categories), n_columns),
         )
 
-    X = sparse.coo_matrix(
-        (
-            aggregated_values.ravel(),
-            (rows_nodes.codes, columns_nodes.codes),
-        ),
-        shape=(len(rows_categories), len(columns_categories)),
-    ).tocsr()
-
     anndata = ad.AnnData(
         X,
-        obs=pd.DataFrame(index=list(map(str, rows_categories))),
+        obs=pd.DataFrame(index=by.index.astype(str).rename(None)),
         var=pd.DataFrame(index=columns_categories),
     )
 
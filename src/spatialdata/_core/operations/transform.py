@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import itertools
 import warnings
 from functools import singledispatch
 from typing import TYPE_CHECKING, Any, cast
@@ -36,31 +35,36 @@ def _transform_raster(
     data: DaskArray, axes: tuple[str, ...], transformation: BaseTransformation, **kwargs: Any
 ) -> tuple[DaskArray, Translation]:
     # dims = {ch: axes.index(ch) for ch in axes}
-    from spatialdata.transformations.transformations import Sequence, Translation
+    from spatialdata.transformations.transformations import Translation
+
+    matrix = transformation.to_affine_matrix(input_axes=axes, output_axes=axes)
+    if np.allclose(matrix[:-1, :-1], np.eye(len(axes))):
+        # pure translation: resampling would return the data unchanged, the translation is only kept as metadata
+        return data, Translation(matrix[:-1, -1], axes=axes)
 
     n_spatial_dims = transformation._get_n_spatial_dims(axes)
-    binary: ArrayLike = np.array(list(itertools.product([0, 1], repeat=n_spatial_dims)))
     spatial_shape = data.shape[len(data.shape) - n_spatial_dims :]
-    binary *= np.array(spatial_shape)
-    c_channel = [np.zeros(len(binary)).reshape((-1, 1))] if "c" in axes else []
-    v: ArrayLike = np.hstack(c_channel + [binary, np.ones(len(binary)).reshape((-1, 1))])
-    matrix = transformation.to_affine_matrix(input_axes=axes, output_axes=axes)
+    # homogeneous coordinates of the corners of the image: an optional (zero) channel column, the spatial coordinates
+    # (0 or the size of the axis, enumerated in the same order as itertools.product([0, 1], repeat=n_spatial_dims)) and
+    # a column of ones
+    n_c = 1 if "c" in axes else 0
+    corners = np.arange(2**n_spatial_dims)
+    v: ArrayLike = np.zeros((len(corners), n_c + n_spatial_dims + 1), dtype=np.float64)
+    for j in range(n_spatial_dims):
+        v[:, n_c + j] = ((corners >> (n_spatial_dims - 1 - j)) & 1) * spatial_shape[j]
+    v[:, -1] = 1.0
     inverse_matrix = transformation.inverse().to_affine_matrix(input_axes=axes, output_axes=axes)
     new_v: ArrayLike = (matrix @ v.T).T
     c_shape: tuple[int, ...]
     c_shape = (data.shape[0],) if "c" in axes else ()
-    new_spatial_shape = tuple(
-        int(np.max(new_v[:, i]) - np.min(new_v[:, i])) for i in range(len(c_shape), n_spatial_dims + len(c_shape))
-    )
+    spatial_columns = new_v[:, len(c_shape) : n_spatial_dims + len(c_shape)]
+    new_spatial_shape = tuple(np.ptp(spatial_columns, axis=0).astype(int).tolist())
     output_shape = c_shape + new_spatial_shape
     translation_vector = np.min(new_v[:, :-1], axis=0)
     translation = Translation(translation_vector, axes=axes)
-    inverse_matrix_adjusted = Sequence(
-        [
-            translation,
-            transformation.inverse(),
-        ]
-    ).to_affine_matrix(input_axes=axes, output_axes=axes)
+    # equivalent to Sequence([translation, transformation.inverse()]).to_affine_matrix(), but reuses the inverse matrix
+    # computed above instead of inverting and composing the transformation a second time
+    inverse_matrix_adjusted = inverse_matrix @ translation.to_affine_matrix(input_axes=axes, output_axes=axes)
 
     # fix chunk shape, it should be possible for the user to specify them,
     # and by default we could reuse the chunk shape of the input
@@ -356,7 +360,8 @@ def _(
     # labels need to be preserved after the resizing of the image
     if schema in (Labels2DModel, Labels3DModel):
         # TODO: this should work, test better
-        kwargs = {"prefilter": False}
+        # nearest neighbor, as for single-scale rasters: the label values are copied instead of being interpolated
+        kwargs = {"prefilter": False, "order": 0}
         channel_names = None
     elif schema in (Image2DModel, Image3DModel):
         kwargs = {}
@@ -411,6 +416,12 @@ def _(
     return transformed_data
 
 
+def _transform_points_partition(df: pd.DataFrame, axes: tuple[str, ...], matrix: ArrayLike) -> pd.DataFrame:
+    coordinates = df[list(axes)].to_numpy() @ matrix[:-1, :-1].T + matrix[:-1, -1]
+    # as before, the coordinate columns come after the other columns, in the order of `axes`
+    return df.drop(columns=list(axes)).assign(**{ax: coordinates[:, i] for i, ax in enumerate(axes)})
+
+
 @transform.register(DaskDataFrame)
 def _(
     data: DaskDataFrame,
@@ -426,25 +437,14 @@ def _(
         data, transformation, maintain_positioning, to_coordinate_system
     )
     axes = get_axes_names(data)
-    arrays = []
-    for ax in axes:
-        arrays.append(data[ax].to_dask_array(lengths=True).reshape(-1, 1))
-    xdata = DataArray(da.concatenate(arrays, axis=1), coords={"points": range(len(data)), "dim": list(axes)})
-    xtransformed = transformation._transform_coordinates(xdata)
-    transformed = data.drop(columns=list(axes)).copy()
+    # as for shapes, the transformation is applied as an affine matrix; this is done partition-wise, so that the result
+    # stays lazy and, when transforming a SpatialData object, all the elements are computed together in a single graph
+    matrix = transformation.to_affine_matrix(input_axes=axes, output_axes=axes)
+    transformed = data.map_partitions(_transform_points_partition, axes=axes, matrix=matrix)
     # dummy transformation that will be replaced by _adjust_transformation()
     default_cs = {DEFAULT_COORDINATE_SYSTEM: Identity()}
     transformed.attrs[TRANSFORM_KEY] = default_cs
 
-    for ax in axes:
-        indices = xtransformed["dim"] == ax
-        new_ax = xtransformed[:, indices]
-        # TODO: discuss with dask team
-        # This is not nice, but otherwise there is a problem with the joint graph of new_ax and transformed, causing
-        # a getattr missing dependency of dependent from_dask_array.
-        new_col = pd.Series(new_ax.data.flatten().compute(), index=transformed.index)
-        transformed[ax] = new_col
-
     old_transformations = cast(dict[str, Any], get_transformation(data, get_all=True))
 
     _set_transformation_for_transformed_elements(
@@ -480,6 +480,9 @@ def _(
     matrix = affine.matrix
     shapely_notation = matrix[:-1, :-1].ravel().tolist() + matrix[:-1, -1].tolist()  # type: ignore[operator]
     transformed_geometry = data.geometry.affine_transform(shapely_notation)
+    # a deep copy, so that in-place edits of the result do not reach the input (without copy-on-write, a shallow copy
+    # shares the column buffers); for the geometry column only the array of references to the (immutable) shapely
+    # geometries is copied
     transformed_data = data.copy(deep=True)
     transformed_data.attrs[TRANSFORM_KEY] = {DEFAULT_COORDINATE_SYSTEM: Identity()}
     transformed_data.geometry = transformed_geometry
@@ -4,16 +4,16 @@ from typing import Any
 import dask
 import numpy as np
 import pandas as pd
+import scipy.ndimage
 import shapely
 import skimage.measure
 from dask.dataframe import DataFrame as DaskDataFrame
 from geopandas import GeoDataFrame
+from numpy.typing import NDArray
 from shapely import MultiPolygon, Point, Polygon
-from skimage.measure._regionprops import RegionProperties
 from xarray import DataArray, DataTree
 
-from spatialdata._core.centroids import get_centroids
-from spatialdata._core.operations.aggregate import aggregate
+from spatialdata._core.centroids import _get_centroids_sums_for_labels
 from spatialdata._logging import logger
 from spatialdata._types import ArrayLike
 from spatialdata.models import (
@@ -27,9 +27,7 @@ from spatialdata.models import (
 )
 from spatialdata.models._utils import points_dask_dataframe_to_geopandas
 from spatialdata.transformations.operations import get_transformation
-from spatialdata.transformations.transformations import Identity
-
-INTRINSIC_COORDINATE_SYSTEM = "__intrinsic"
+from spatialdata.transformations.transformations import BaseTransformation
 
 
 @singledispatch
@@ -71,44 +69,37 @@ def _(element: DataArray | DataTree, **kwargs: Any) -> GeoDataFrame:
         raise RuntimeError("to_circles() is not supported for 3D labels.")
 
     # reduce to the single scale case
-    if isinstance(element, DataTree):
-        element_single_scale = element["scale0"].values().__iter__().__next__()
-    else:
-        element_single_scale = element
-    shape = element_single_scale.shape
+    element_single_scale = next(iter(element["scale0"].values())) if isinstance(element, DataTree) else element
 
-    # find the area of labels, estimate the radius from it; find the centroids
     axes = get_axes_names(element)
-    model = Image3DModel if "z" in axes else Image2DModel
-    ones = model.parse(np.ones((1,) + shape), dims=("c",) + axes)
-    aggregated = aggregate(values=ones, by=element_single_scale, agg_func="sum")["table"]
-    areas = aggregated.X.todense().A1.reshape(-1)
-    aobs = aggregated.obs
-    aobs["areas"] = areas
-    aobs["radius"] = np.sqrt(areas / np.pi)
-
-    # get the centroids; remove the background if present (the background is not considered during aggregation)
-    centroids = _get_centroids(element)
-    if 0 in centroids.index:
-        centroids = centroids.drop(index=0)
-    # instance_id is the key used by the aggregation APIs
-    aobs.index = aobs["instance_id"]
-    aobs.index.name = None
-    assert len(aobs) == len(centroids)
-    obs = pd.merge(aobs, centroids, left_index=True, right_index=True, how="inner")
-    assert len(obs) == len(centroids)
-    return _make_circles(element, obs)
+    transformations = get_transformation(element, get_all=True)
+    assert isinstance(transformations, dict)
+    # the area (number of pixels) and the centroid (in the intrinsic coordinate system, i.e. the pixel coordinates of
+    # the labels) of each label are found in a single pass over the labels; the radius is estimated from the area
+    sums = _get_centroids_sums_for_labels(element_single_scale)
+    # remove the background if present
+    if 0 in sums.index:
+        sums = sums.drop(index=0)
+    obs = sums[list(axes)].div(sums["count"], axis=0)
+    obs["radius"] = np.sqrt(sums["count"].to_numpy() / np.pi)
+    return _make_circles(obs, axes, transformations)
 
 
 @to_circles.register(GeoDataFrame)
 def _(element: GeoDataFrame, **kwargs: Any) -> GeoDataFrame:
     assert len(kwargs) == 0
     if isinstance(element.geometry.iloc[0], Polygon | MultiPolygon):
-        radius = np.sqrt(element.geometry.area / np.pi)
-        centroids = _get_centroids(element)
-        obs = pd.DataFrame({"radius": radius})
-        obs = pd.merge(obs, centroids, left_index=True, right_index=True, how="inner")
-        return _make_circles(element, obs)
+        # the shapes are in memory: the areas and the centroids (in the intrinsic coordinate system) are computed
+        # directly with the vectorized shapely functions, without building and computing a Points element with
+        # get_centroids()
+        geometries = element.geometry.values
+        xy = shapely.get_coordinates(shapely.centroid(geometries))
+        obs = pd.DataFrame(
+            {"radius": np.sqrt(shapely.area(geometries) / np.pi), "x": xy[:, 0], "y": xy[:, 1]}, index=element.index
+        )
+        transformations = get_transformation(element, get_all=True)
+        assert isinstance(transformations, dict)
+        return _make_circles(obs, ("x", "y"), transformations)
     if isinstance(element.geometry.iloc[0], Point):
         return element
     raise RuntimeError(f"Unsupported geometry type: {type(element.geometry.iloc[0])}")
@@ -128,22 +119,10 @@ def _(element: DaskDataFrame, radius: float | ArrayLike | None = None) -> GeoDat
     return gdf
 
 
-def _get_centroids(element: SpatialElement) -> pd.DataFrame:
-    d = get_transformation(element, get_all=True)
-    assert isinstance(d, dict)
-    if INTRINSIC_COORDINATE_SYSTEM in d:
-        raise RuntimeError(f"The name {INTRINSIC_COORDINATE_SYSTEM} is reserved.")
-    d[INTRINSIC_COORDINATE_SYSTEM] = Identity()
-    centroids = get_centroids(element, coordinate_system=INTRINSIC_COORDINATE_SYSTEM).compute()
-    del d[INTRINSIC_COORDINATE_SYSTEM]
-    return centroids
-
-
-def _make_circles(element: DataArray | DataTree | GeoDataFrame, obs: pd.DataFrame) -> GeoDataFrame:
-    spatial_axes = sorted(get_axes_names(element))
-    centroids = obs[spatial_axes].values
-    transformations = get_transformation(element, get_all=True)
-    assert isinstance(transformations, dict)
+def _make_circles(
+    obs: pd.DataFrame, axes: tuple[str, ...], transformations: dict[str, BaseTransformation]
+) -> GeoDataFrame:
+    centroids = obs[sorted(axes)].values
     return ShapesModel.parse(
         centroids,
         geometry=0,
@@ -194,28 +173,37 @@ def _(
         raise RuntimeError("to_polygons() is not supported for 3D labels.")
 
     # reduce to the single scale case
-    if isinstance(element, DataTree):
-        element_single_scale = element["scale0"].values().__iter__().__next__()
-    else:
-        element_single_scale = element
+    element_single_scale = next(iter(element["scale0"].values())) if isinstance(element, DataTree) else element
 
     chunk_sizes = element_single_scale.data.chunks
 
-    def _vectorize_chunk(chunk: np.ndarray, yoff: int, xoff: int) -> GeoDataFrame:  # type: ignore[type-arg]
-        gdf = _vectorize_mask(chunk)
-        gdf["chunk-location"] = f"({yoff}, {xoff})"
-        gdf.geometry = gdf.translate(xoff, yoff)
-        return gdf
-
+    # offsets of the chunks along y and x, computed once instead of summing the chunk sizes for every chunk
+    y_offsets = np.cumsum((0,) + chunk_sizes[0][:-1]).tolist()
+    x_offsets = np.cumsum((0,) + chunk_sizes[1][:-1]).tolist()
     tasks = [
-        dask.delayed(_vectorize_chunk)(chunk, sum(chunk_sizes[0][:iy]), sum(chunk_sizes[1][:ix]))
+        dask.delayed(_vectorize_mask)(chunk, y_offsets[iy], x_offsets[ix])
         for iy, row in enumerate(element_single_scale.data.to_delayed())
         for ix, chunk in enumerate(row)
     ]
 
-    results = dask.compute(*tasks)
-    gdf = pd.concat(results)
-    gdf = GeoDataFrame([_dissolve_on_overlaps(*item) for item in gdf.groupby("label")], columns=["label", "geometry"])
+    # with a single chunk there is nothing to parallelize: the synchronous scheduler avoids the overhead of the pool
+    results = dask.compute(*tasks, scheduler="synchronous" if len(tasks) == 1 else None)
+    # the labels, geometries and chunk of origin of all the chunks are concatenated as arrays (instead of concatenating
+    # the GeoDataFrames), and the geometries are then grouped by label by sorting the labels
+    results = [r for r in results if len(r) > 0] or [GeoDataFrame({"label": np.array([], dtype=int)}, geometry=[])]
+    labels = np.concatenate([r["label"].to_numpy() for r in results])
+    geometries = np.concatenate([np.asarray(r.geometry.values) for r in results])
+    chunk_ids = np.repeat(np.arange(len(results)), [len(r) for r in results])
+    order = np.argsort(labels, kind="stable")
+    unique_labels, starts = np.unique(labels[order], return_index=True)
+    groups = np.split(order, starts[1:]) if len(order) > 0 else []
+    gdf = GeoDataFrame(
+        {
+            "label": unique_labels,
+            "geometry": _dissolve_on_overlaps(geometries, chunk_ids, groups),
+        },
+        geometry="geometry",
+    )
     gdf.index = gdf["label"]
 
     transformations = get_transformation(element_single_scale, get_all=True)
@@ -225,42 +213,83 @@ def _(
     return ShapesModel.parse(gdf, transformations=transformations.copy())
 
 
-def _region_props_to_polygon(region_props: RegionProperties) -> MultiPolygon | Polygon:
-    mask = np.pad(region_props.image, 1)
+def _region_to_contours(image: ArrayLike, yoff: int, xoff: int) -> list[ArrayLike]:
+    mask = np.pad(image, 1)
     contours = skimage.measure.find_contours(mask, 0.5)
 
     invalid_polygons = any(contour.shape[0] <= 3 for contour in contours)
     if invalid_polygons:
         # this should not happen because even a single pixel should can be converted to a polygon
         raise RuntimeError("Invalid polygon found in the region properties.")
-    polygons = [Polygon(contour[:, [1, 0]]) for contour in contours]
-
-    polygon = MultiPolygon(polygons) if len(polygons) > 1 else polygons[0]
-
-    yoff, xoff, *_ = region_props.bbox
-    return shapely.affinity.translate(polygon, xoff - 1, yoff - 1)  # account for the padding
+    # (x, y) coordinates, translated to the position of the region (accounting for the padding)
+    offset = np.array([xoff - 1, yoff - 1])
+    return [contour[:, [1, 0]] + offset for contour in contours]
 
 
 def _vectorize_mask(
     mask: np.ndarray,  # type: ignore[type-arg]
+    yoff: int = 0,
+    xoff: int = 0,
 ) -> GeoDataFrame:
-    if mask.max() == 0:
+    # (yoff, xoff) is the position of the mask (e.g. of a chunk) in the full labels; it is added to the coordinates of
+    # the contours, so that the polygons are created at their final position
+    # a sparse probe of the mask is enough to tell that most chunks are not empty; the whole mask is scanned only when
+    # the probe finds nothing
+    if not mask[(slice(None, None, 64),) * mask.ndim].any() and not mask.any():
         return GeoDataFrame({"label": []}, geometry=[])
 
-    regions = skimage.measure.regionprops(mask)
+    # the bounding box of each label is found in a single pass; the labels absent from the mask have no bounding box
+    slices = scipy.ndimage.find_objects(mask)
+    labels = np.array([i + 1 for i, sl in enumerate(slices) if sl is not None])
+    contours = [
+        _region_to_contours(mask[sl] == i + 1, yoff + sl[0].start, xoff + sl[1].start)
+        for i, sl in enumerate(slices)
+        if sl is not None
+    ]
+    # find_objects ignores the non-positive values, so a mask may have no labels even if it is not all zeros
+    if labels.size == 0:
+        return GeoDataFrame({"label": []}, geometry=[])
 
-    return GeoDataFrame(
-        {"label": [region.label for region in regions]},
-        geometry=[_region_props_to_polygon(region) for region in regions],
+    # the polygons of all the regions are created at once with the vectorized shapely constructors: one polygon per
+    # contour, and a multipolygon for the regions with more than one contour
+    n_contours = np.array([len(c) for c in contours])
+    flat_contours = [contour for region_contours in contours for contour in region_contours]
+    rings = shapely.linearrings(
+        np.concatenate(flat_contours),
+        indices=np.repeat(np.arange(len(flat_contours)), [len(contour) for contour in flat_contours]),
     )
-
-
-def _dissolve_on_overlaps(label: int, group: GeoDataFrame) -> GeoDataFrame:
-    if len(group) == 1:
-        return (label, group.geometry.iloc[0])
-    if len(np.unique(group["chunk-location"])) == 1:
-        return (label, MultiPolygon(list(group.geometry)))
-    return (label, group.dissolve().geometry.iloc[0])
+    polygons = shapely.polygons(rings)
+    geometry = polygons[np.cumsum(n_contours) - n_contours]
+    region_indices = np.repeat(np.arange(len(labels)), n_contours)
+    in_multi = (n_contours > 1)[region_indices]
+    if in_multi.any():
+        # the entries of the regions with a single contour are left untouched
+        shapely.multipolygons(polygons[in_multi], indices=region_indices[in_multi], out=geometry)
+
+    return GeoDataFrame({"label": labels}, geometry=geometry)
+
+
+def _dissolve_on_overlaps(
+    geometries: NDArray[Any], chunk_ids: NDArray[np.intp], groups: list[NDArray[np.intp]]
+) -> NDArray[Any]:
+    # one geometry per group (i.e. per label): the geometry itself if it is the only one, a multipolygon if the
+    # geometries come from the same chunk, otherwise their union (the labels split across chunks are merged with a
+    # single call)
+    dissolved = geometries[[group[0] for group in groups]]
+    to_union = []
+    for i, group in enumerate(groups):
+        if len(group) == 1:
+            continue
+        if len(np.unique(chunk_ids[group])) == 1:
+            dissolved[i] = MultiPolygon(list(geometries[group]))
+        else:
+            to_union.append(i)
+    if to_union:
+        padded = np.full((len(to_union), max(len(groups[i]) for i in to_union)), None, dtype=object)
+        for row, i in enumerate(to_union):
+            padded[row, : len(groups[i])] = geometries[groups[i]]
+        dissolved[to_union] = shapely.union_all(padded, axis=1)
+    return dissolved
 
 
 @to_polygons.register(GeoDataFrame)
@@ -174,7 +174,9 @@ def _filter_table_by_elements(
     instances = None
     for _, elements in elements_dict.items():
         for name, element in elements.items():
-            if get_model(element) == Labels2DModel or get_model(element) == Labels3DModel:
+            # get_model() validates the element, so it is called only once per element
+            model = get_model(element)
+            if model in (Labels2DModel, Labels3DModel):
                 if isinstance(element, DataArray):
                     # get unique labels value (including 0 if present)
                     instances = da.unique(element.data).compute()
@@ -186,10 +188,10 @@ def _filter_table_by_elements(
                     # can be slow
                     instances = da.unique(xdata.data).compute()
                 instances = np.sort(instances)
-            elif get_model(element) == ShapesModel:
+            elif model == ShapesModel:
                 instances = element.index.to_numpy()
-            elif get_model(element) == PointsModel:
-                instances = element.compute().index.to_numpy()
+            elif model == PointsModel:
+                instances = element.index.compute().to_numpy()
             else:
                 continue
             indices = ((table.obs[region_key] == name) & (table.obs[instance_key].isin(instances))).to_numpy()
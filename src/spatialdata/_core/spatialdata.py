@@ -13,13 +13,13 @@ import pandas as pd
 import zarr
 from anndata import AnnData
 from dask.dataframe import DataFrame as DaskDataFrame
-from dask.dataframe import Scalar, read_parquet
+from dask.dataframe import Scalar
 from geopandas import GeoDataFrame
 from shapely import MultiPolygon, Polygon
 from xarray import DataArray, DataTree
 from zarr.errors import GroupNotFoundError
 
-from spatialdata._core._elements import Images, Labels, Points, Shapes, Tables
+from spatialdata._core._elements import Elements, Images, Labels, Points, Shapes, Tables
 from spatialdata._core.validation import (
     check_all_keys_case_insensitively_unique,
     check_target_region_column_symmetry,
@@ -64,6 +64,9 @@ Shape_s = ShapesModel()
 Point_s = PointsModel()
 Table_s = TableModel()
 
+# the element types, in the order in which they are stored in the SpatialData object
+_ELEMENT_TYPES = ("images", "labels", "points", "shapes", "tables")
+
 
 class SpatialData:
     """
@@ -580,7 +583,7 @@ class SpatialData:
         found: list[SpatialElement] = []
         found_element_type: list[str] = []
         found_element_name: list[str] = []
-        for element_type in ["images", "labels", "points", "shapes", "tables"]:
+        for element_type in _ELEMENT_TYPES:
             for element_name, element_value in getattr(self, element_type).items():
                 if element_value is element:
                     found.append(element_value)
@@ -627,16 +630,14 @@ class SpatialData:
         element_names_in_coordinate_system = []
         if isinstance(coordinate_system, str):
             coordinate_system = [coordinate_system]
+        coordinate_systems = set(coordinate_system)
         for element_type, element_name, element in self._gen_elements():
             if element_type != "tables":
                 transformations = get_transformation(element, get_all=True)
                 assert isinstance(transformations, dict)
-                for cs in coordinate_system:
-                    if cs in transformations:
-                        if element_type not in elements:
-                            elements[element_type] = {}
-                        elements[element_type][element_name] = element
-                        element_names_in_coordinate_system.append(element_name)
+                if not coordinate_systems.isdisjoint(transformations):
+                    elements.setdefault(element_type, {})[element_name] = element
+                    element_names_in_coordinate_system.append(element_name)
         tables = self._filter_tables(
             set(),
             filter_tables,
@@ -973,7 +974,7 @@ class SpatialData:
         The paths are relative to the root of the SpatialData object and are in the format "element_type/element_name".
         """
         elements_in_sdata = []
-        for element_type in ["images", "labels", "points", "shapes", "tables"]:
+        for element_type in _ELEMENT_TYPES:
             for element_name in getattr(self, element_type):
                 elements_in_sdata.append(f"{element_type}/{element_name}")
         return elements_in_sdata
@@ -1002,7 +1003,7 @@ class SpatialData:
                 elements_in_zarr.append(path)
 
         for element_type in root:
-            if element_type in ["images", "labels", "points", "shapes", "tables"]:
+            if element_type in _ELEMENT_TYPES:
                 for element_name in root[element_type]:
                     path = f"{element_type}/{element_name}"
                     elements_in_zarr.append(path)
@@ -1111,6 +1112,7 @@ class SpatialData:
         consolidate_metadata: bool = True,
         update_sdata_path: bool = True,
         sdata_formats: SpatialDataFormatType | list[SpatialDataFormatType] | None = None,
+        compressor: dict[Literal["lz4", "zstd"], int] | None = None,
     ) -> None:
         """
         Write the `SpatialData` object to a Zarr store.
@@ -1155,11 +1157,22 @@ class SpatialData:
             unspecified, the element formats will be set to the latest element format compatible with the specified
             SpatialData container format. All the formats and relationships between them are defined in
             `spatialdata._io.format.py`.
+        compressor
+            Only usable with the Zarr v2 based raster formats (`RasterFormatV01`, `RasterFormatV02`), to be selected via
+            `sdata_formats`: the default (Zarr v3) raster format does not support it, and passing it together with
+            that format raises a `ValueError` (Zarr v3 raster data is compressed with Zstd by default). A dictionary
+            with a single item mapping the Blosc compression algorithm (`'lz4'` or `'zstd'`) to the compression level
+            (0-9) used for writing the raster elements (images and labels), e.g. `{'zstd': 3}`. Bit-shuffling is
+            applied before compression. If `None` (default), the default compression of `ome-zarr` is used.
         """
         from spatialdata._io._utils import _resolve_zarr_store
         from spatialdata._io.format import _parse_formats
+        from spatialdata._io.io_raster import _validate_compressor
 
         parsed = _parse_formats(sdata_formats)
+        # fail before anything is written if the compressor cannot be used with the raster format
+        if compressor is not None:
+            _validate_compressor(compressor, zarr_format=parsed["raster"].zarr_format)
 
         if isinstance(file_path, str):
             file_path = Path(file_path)
@@ -1170,17 +1183,28 @@ class SpatialData:
         zarr_format = parsed["SpatialData"].zarr_format
         zarr_group = zarr.create_group(store=store, overwrite=overwrite, zarr_format=zarr_format)
         self.write_attrs(zarr_group=zarr_group, sdata_format=parsed["SpatialData"])
-        store.close()
-
-        for element_type, element_name, element in self.gen_elements():
-            self._write_element(
-                element=element,
-                zarr_container_path=file_path,
-                element_type=element_type,
-                element_name=element_name,
-                overwrite=False,
-                parsed_formats=parsed,
-            )
+        # Each element type group is created once and reused for all its elements, instead of reopening the root and
+        # element type groups for every element.
+        element_type_groups: dict[str, zarr.Group] = {}
+        try:
+            for element_type, element_name, element in self.gen_elements():
+                if element_type not in element_type_groups:
+                    element_type_groups[element_type] = zarr_group.require_group(element_type)
+                element_type_group = element_type_groups[element_type]
+                self._write_element(
+                    element=element,
+                    zarr_container_path=file_path,
+                    element_type=element_type,
+                    element_name=element_name,
+                    overwrite=False,
+                    parsed_formats=parsed,
+                    compressor=compressor,
+                    # the store has just been (re)created and validated above, so the element paths do not exist yet
+                    skip_overwrite_check=True,
+                    groups=(zarr_group, element_type_group, element_type_group.require_group(element_name)),
+                )
+        finally:
+            store.close()
 
         if self.path != file_path and update_sdata_path:
             self.path = file_path
@@ -1196,6 +1220,9 @@ class SpatialData:
         element_name: str,
         overwrite: bool,
         parsed_formats: dict[str, SpatialDataFormatType] | None = None,
+        compressor: dict[Literal["lz4", "zstd"], int] | None = None,
+        skip_overwrite_check: bool = False,
+        groups: tuple[zarr.Group, zarr.Group, zarr.Group] | None = None,
     ) -> None:
         from spatialdata._io.io_zarr import _get_groups_for_element
 
@@ -1203,14 +1230,20 @@ class SpatialData:
             raise ValueError(
                 f"zarr_container_path must be a Path object, type(zarr_container_path) = {type(zarr_container_path)}."
             )
-        file_path_of_element = zarr_container_path / element_type / element_name
-        self._validate_can_safely_write_to_path(
-            file_path=file_path_of_element, overwrite=overwrite, saving_an_element=True
-        )
+        if not skip_overwrite_check:
+            file_path_of_element = zarr_container_path / element_type / element_name
+            self._validate_can_safely_write_to_path(
+                file_path=file_path_of_element, overwrite=overwrite, saving_an_element=True
+            )
 
-        root_group, element_type_group, element_group = _get_groups_for_element(
-            zarr_path=zarr_container_path, element_type=element_type, element_name=element_name, use_consolidated=False
-        )
+        if groups is None:
+            groups = _get_groups_for_element(
+                zarr_path=zarr_container_path,
+                element_type=element_type,
+                element_name=element_name,
+                use_consolidated=False,
+            )
+        root_group, element_type_group, element_group = groups
         from spatialdata._io import (
             write_image,
             write_labels,
@@ -1229,6 +1262,7 @@ class SpatialData:
                 group=element_group,
                 name=element_name,
                 element_format=parsed_formats["raster"],
+                compressor=compressor,
             )
         elif element_type == "labels":
             write_labels(
@@ -1236,6 +1270,7 @@ class SpatialData:
                 group=root_group,
                 name=element_name,
                 element_format=parsed_formats["raster"],
+                compressor=compressor,
             )
         elif element_type == "points":
             write_points(
@@ -1264,6 +1299,7 @@ class SpatialData:
         element_name: str | list[str],
         overwrite: bool = False,
         sdata_formats: SpatialDataFormatType | list[SpatialDataFormatType] | None = None,
+        compressor: dict[Literal["lz4", "zstd"], int] | None = None,
     ) -> None:
         """
         Write a single element, or a list of elements, to the Zarr store used for backing.
@@ -1279,6 +1315,9 @@ class SpatialData:
         sdata_formats
             It is recommended to leave this parameter equal to `None`. See more details in the documentation of
              `SpatialData.write()`.
+        compressor
+            The compression used for raster elements, only usable with the Zarr v2 based raster formats (not with the
+            default format). See more details in the documentation of `SpatialData.write()`.
 
         Notes
         -----
@@ -1286,19 +1325,28 @@ class SpatialData:
         an element, the writing of the remaining elements will not be attempted.
         """
         from spatialdata._io.format import _parse_formats
+        from spatialdata._io.io_raster import _validate_compressor
 
         parsed_formats = _parse_formats(formats=sdata_formats)
+        if compressor is not None:
+            _validate_compressor(compressor, zarr_format=parsed_formats["raster"].zarr_format)
 
         if isinstance(element_name, list):
             for name in element_name:
                 assert isinstance(name, str)
-                self.write_element(name, overwrite=overwrite, sdata_formats=sdata_formats)
+                self.write_element(name, overwrite=overwrite, sdata_formats=sdata_formats, compressor=compressor)
             return
 
         check_valid_name(element_name)
         self._validate_element_names_are_unique()
-        element = self.get(element_name)
-        if element is None:
+        element_type = None
+        element = None
+        for _element_type, _element_name, _element in self.gen_elements():
+            if _element_name == element_name:
+                element_type = _element_type
+                element = _element
+                break
+        if element_type is None:
             raise ValueError(f"Element with name {element_name} not found in SpatialData object.")
 
         if self.path is None:
@@ -1307,13 +1355,6 @@ class SpatialData:
                 "disk."
             )
 
-        element_type = None
-        for _element_type, _element_name, _ in self.gen_elements():
-            if _element_name == element_name:
-                element_type = _element_type
-                break
-        if element_type is None:
-            raise ValueError(f"Element with name {element_name} not found in SpatialData object.")
         if element_type == "tables":
             validate_table_attr_keys(element)
 
@@ -1326,6 +1367,7 @@ class SpatialData:
             element_name=element_name,
             overwrite=overwrite,
             parsed_formats=parsed_formats,
+            compressor=compressor,
         )
         # After every write, metadata should be consolidated, otherwise this can lead to IO problems like when deleting.
         if self.has_consolidated_metadata():
@@ -1606,21 +1648,10 @@ class SpatialData:
 
     def _element_type_from_element_name(self, element_name: str) -> str:
         self._validate_element_names_are_unique()
-        element = self.get(element_name)
-        if element is None:
-            raise ValueError(f"Element with name {element_name} not found in SpatialData object.")
-
-        located = self.locate_element(element)
-        element_type = None
-        for path in located:
-            found_element_type, found_element_name = path.split("/")
-            if element_name == found_element_name:
-                element_type = found_element_type
-                break
-        if element_type is None:
-            pass
-        assert element_type is not None
-        return element_type
+        for element_type, found_element_name, _ in self.gen_elements():
+            if found_element_name == element_name:
+                return element_type
+        raise ValueError(f"Element with name {element_name} not found in SpatialData object.")
 
     def _element_type_and_name_from_element_path(self, element_path: str) -> tuple[str, str]:
         element_type, element_name = element_path.split("/")
@@ -1805,7 +1836,6 @@ class SpatialData:
         self._shared_keys = self._shared_keys - set(self._tables.keys())
         self._tables = Tables(shared_keys=self._shared_keys)
         for k, v in tables.items():
-            TableModel().validate(v)
             self._tables[k] = v
 
     @staticmethod
@@ -1893,13 +1923,12 @@ class SpatialData:
     def coordinate_systems(self) -> list[str]:
         from spatialdata.transformations.operations import get_transformation
 
-        all_cs = set()
+        all_cs: set[str] = set()
         gen = self._gen_spatial_element_values()
         for obj in gen:
             transformations = get_transformation(obj, get_all=True)
             assert isinstance(transformations, dict)
-            for cs in transformations:
-                all_cs.add(cs)
+            all_cs.update(transformations)
         return list(all_cs)
 
     def _non_empty_elements(self) -> list[str]:
@@ -1910,10 +1939,9 @@ class SpatialData:
         non_empty_elements
             The names of the elements that are not empty.
         """
-        all_elements = ["images", "labels", "points", "shapes", "tables"]
         return [
             element
-            for element in all_elements
+            for element in _ELEMENT_TYPES
             if (getattr(self, element) is not None) and (len(getattr(self, element)) > 0)
         ]
 
@@ -1932,16 +1960,9 @@ class SpatialData:
         """
         from spatialdata._utils import _natural_keys
 
-        def rreplace(s: str, old: str, new: str, occurrence: int) -> str:
-            li = s.rsplit(old, occurrence)
-            return new.join(li)
-
-        def h(s: str) -> str:
-            return hashlib.md5(repr(s).encode()).hexdigest()
-
-        descr = "SpatialData object"
+        parts = ["SpatialData object"]
         if self.path is not None:
-            descr += f", with associated Zarr store: {self.path.resolve()}"
+            parts.append(f", with associated Zarr store: {self.path.resolve()}")
 
         non_empty_elements = self._non_empty_elements()
         last_element_index = len(non_empty_elements) - 1
@@ -1949,31 +1970,28 @@ class SpatialData:
             last_attr = attr_index == last_element_index
             attribute = getattr(self, attr)
 
-            descr += f"\n{h('level0')}{attr.capitalize()}"
+            parts.append(f"\n{'└── ' if last_attr else '├── '}{attr.capitalize()}")
+            indent = "\n  " if last_attr else "\n│ "
 
             unsorted_elements = attribute.items()
             sorted_elements = sorted(unsorted_elements, key=lambda x: _natural_keys(x[0]))
-            for k, v in sorted_elements:
-                descr += f"{h('empty_line')}"
+            last_child_index = len(sorted_elements) - 1
+            for child_index, (k, v) in enumerate(sorted_elements):
+                branch = "    └── " if child_index == last_child_index else "    ├── "
+                parts.append(f"{indent}{branch}")
                 descr_class = v.__class__.__name__
                 if attr == "shapes":
-                    descr += f"{h(attr + 'level1.1')}{k!r}: {descr_class} shape: {v.shape} (2D shapes)"
+                    parts.append(f"{k!r}: {descr_class} shape: {v.shape} (2D shapes)")
                 elif attr == "points":
-                    length: int | None = None
-                    if len(v.dask) == 1:
-                        name, layer = v.dask.items().__iter__().__next__()
-                        if "read-parquet" in name:
-                            t = layer.creation_info["args"]
-                            assert isinstance(t, tuple)
-                            assert len(t) == 1
-                            parquet_file = t[0]
-                            table = read_parquet(parquet_file)
-                            length = len(table)
-                        else:
-                            # length = len(v)
-                            length = None
+                    # inspect the lightweight expression rather than v.dask, which would materialize the whole task
+                    # graph; the number of rows of an unmodified Parquet read is obtained from the file metadata
+                    try:
+                        from dask.dataframe.dask_expr.io.parquet import ReadParquet
+                    except ImportError:
+                        # the module path of the dask-expr internals is not part of the public dask API
+                        length: int | None = None
                     else:
-                        length = None
+                        length = len(v) if isinstance(v.expr, ReadParquet) else None
 
                     n = len(get_axes_names(v))
                     dim_string = f"({n}D points)"
@@ -1987,12 +2005,12 @@ class SpatialData:
                             + ", ".join([(str(dim) if not isinstance(dim, Scalar) else "<Delayed>") for dim in v.shape])
                             + ")"
                         )
-                    descr += f"{h(attr + 'level1.1')}{k!r}: {descr_class} with shape: {shape_str} {dim_string}"
+                    parts.append(f"{k!r}: {descr_class} with shape: {shape_str} {dim_string}")
                 elif attr == "tables":
-                    descr += f"{h(attr + 'level1.1')}{k!r}: {descr_class} {v.shape}"
+                    parts.append(f"{k!r}: {descr_class} {v.shape}")
                 else:
                     if isinstance(v, DataArray):
-                        descr += f"{h(attr + 'level1.1')}{k!r}: {descr_class}[{''.join(v.dims)}] {v.shape}"
+                        parts.append(f"{k!r}: {descr_class}[{''.join(v.dims)}] {v.shape}")
                     elif isinstance(v, DataTree):
                         shapes = []
                         dims: str | None = None
@@ -2005,39 +2023,26 @@ class SpatialData:
                             if dims is None:
                                 dims = "".join(vv.dims)
                             shapes.append(shape)
-                        descr += f"{h(attr + 'level1.1')}{k!r}: {descr_class}[{dims}] {', '.join(map(str, shapes))}"
+                        parts.append(f"{k!r}: {descr_class}[{dims}] {', '.join(map(str, shapes))}")
                     else:
                         raise TypeError(f"Unknown type {type(v)}")
-            if last_attr is True:
-                descr = descr.replace(h("empty_line"), "\n  ")
-            else:
-                descr = descr.replace(h("empty_line"), "\n│ ")
-
-        descr = rreplace(descr, h("level0"), "└── ", 1)
-        descr = descr.replace(h("level0"), "├── ")
-
-        for attr in ["images", "labels", "points", "tables", "shapes"]:
-            descr = rreplace(descr, h(attr + "level1.1"), "    └── ", 1)
-            descr = descr.replace(h(attr + "level1.1"), "    ├── ")
 
         from spatialdata.transformations.operations import get_transformation
 
-        descr += "\nwith coordinate systems:\n"
-        coordinate_systems = self.coordinate_systems.copy()
-        coordinate_systems.sort(key=_natural_keys)
+        # a single pass over the elements collects both the coordinate systems and the elements contained in each of
+        # them, instead of iterating over all the elements once per coordinate system
+        elements_by_cs: dict[str, dict[str, list[str]]] = {}
+        for k, name, obj in self._gen_elements():
+            transformations = get_transformation(obj, get_all=True)
+            assert isinstance(transformations, dict)
+            for target_cs in transformations:
+                elements_by_cs.setdefault(target_cs, {}).setdefault(k, []).append(name)
+
+        parts.append("\nwith coordinate systems:\n")
+        coordinate_systems = sorted(elements_by_cs, key=_natural_keys)
         for i, cs in enumerate(coordinate_systems):
-            descr += f"    ▸ {cs!r}"
-            gen = self._gen_elements()
-            elements_in_cs: dict[str, list[str]] = {}
-            for k, name, obj in gen:
-                if not isinstance(obj, AnnData):
-                    transformations = get_transformation(obj, get_all=True)
-                    assert isinstance(transformations, dict)
-                    target_css = transformations.keys()
-                    if cs in target_css:
-                        if k not in elements_in_cs:
-                            elements_in_cs[k] = []
-                        elements_in_cs[k].append(name)
+            parts.append(f"    ▸ {cs!r}")
+            elements_in_cs = elements_by_cs[cs]
             for element_names in elements_in_cs.values():
                 element_names.sort(key=_natural_keys)
             if len(elements_in_cs) > 0:
@@ -2048,9 +2053,9 @@ class SpatialData:
                         for element_name in element_names
                     ]
                 )
-                descr += f", with elements:\n        {elements}"
+                parts.append(f", with elements:\n        {elements}")
             if i < len(coordinate_systems) - 1:
-                descr += "\n"
+                parts.append("\n")
 
         from spatialdata._io._utils import get_dask_backing_files
 
@@ -2060,24 +2065,24 @@ class SpatialData:
 
         if not self.is_self_contained():
             assert self.path is not None
-            descr += "\nwith the following Dask-backed elements not being self-contained:"
+            parts.append("\nwith the following Dask-backed elements not being self-contained:")
             description = self.elements_are_self_contained()
             for _, element_name, element in self.gen_elements():
                 if not description[element_name]:
                     backing_files = ", ".join(get_dask_backing_files(element))
-                    descr += f"\n    ▸ {element_name}: {backing_files}"
+                    parts.append(f"\n    ▸ {element_name}: {backing_files}")
 
         if self.path is not None:
             elements_only_in_sdata, elements_only_in_zarr = self._symmetric_difference_with_zarr_store()
             if len(elements_only_in_sdata) > 0:
-                descr += "\nwith the following elements not in the Zarr store:"
+                parts.append("\nwith the following elements not in the Zarr store:")
                 for element_path in elements_only_in_sdata:
-                    descr += f"\n    ▸ {_element_path_to_element_name_with_type(element_path)}"
+                    parts.append(f"\n    ▸ {_element_path_to_element_name_with_type(element_path)}")
             if len(elements_only_in_zarr) > 0:
-                descr += "\nwith the following elements in the Zarr store but not in the SpatialData object:"
+                parts.append("\nwith the following elements in the Zarr store but not in the SpatialData object:")
                 for element_path in elements_only_in_zarr:
-                    descr += f"\n    ▸ {_element_path_to_element_name_with_type(element_path)}"
-        return descr
+                    parts.append(f"\n    ▸ {_element_path_to_element_name_with_type(element_path)}")
+        return "".join(parts)
 
     def _gen_spatial_element_values(self) -> Generator[SpatialElement, None, None]:
         """
@@ -2089,8 +2094,7 @@ class SpatialData:
             A generator that yields spatial element objects contained in the SpatialData instance.
 
         """
-        for element_type in ["images", "labels", "points", "shapes"]:
-            d = getattr(SpatialData, element_type).fget(self)
+        for d in (self._images, self._labels, self._points, self._shapes):
             yield from d.values()
 
     def _gen_elements(
@@ -2109,11 +2113,15 @@ class SpatialData:
         A generator object that returns a tuple containing the type of the element, its name, and the element
         itself.
         """
-        element_types = ["images", "labels", "points", "shapes"]
+        containers: list[tuple[str, Elements[Any]]] = [
+            ("images", self._images),
+            ("labels", self._labels),
+            ("points", self._points),
+            ("shapes", self._shapes),
+        ]
         if include_tables:
-            element_types.append("tables")
-        for element_type in element_types:
-            d = getattr(SpatialData, element_type).fget(self)
+            containers.append(("tables", self._tables))
+        for element_type, d in containers:
             for k, v in d.items():
                 yield element_type, k, v
 
@@ -35,6 +35,33 @@ from spatialdata.transformations._utils import (
 )
 
 
+def _validate_compressor(compressor: dict[Literal["lz4", "zstd"], int], zarr_format: int) -> None:
+    """Check that `compressor` describes a Blosc codec that can be used for raster data with the given Zarr format."""
+    if zarr_format != 2:
+        # ome-zarr forwards the codec to zarr as `compressor`, which zarr does not accept for zarr v3 arrays (and the
+        # `compressors` argument for the v3 codec pipeline is not forwarded by ome-zarr when writing dask arrays)
+        raise ValueError(
+            "Setting the compressor is only supported for raster formats based on Zarr v2 (RasterFormatV01, "
+            "RasterFormatV02). Raster data written with Zarr v3 is compressed with Zstd by default."
+        )
+    if len(compressor) != 1:
+        raise ValueError(f"Expected a single compression algorithm, got {list(compressor)}.")
+    cname, clevel = next(iter(compressor.items()))
+    if cname not in ("lz4", "zstd"):
+        raise ValueError(f"Unsupported compression algorithm: {cname!r}. Expected 'lz4' or 'zstd'.")
+    if not isinstance(clevel, int) or not 0 <= clevel <= 9:
+        raise ValueError(f"The compression level must be an integer between 0 and 9, got {clevel!r}.")
+
+
+def _get_compressor(compressor: dict[Literal["lz4", "zstd"], int], zarr_format: int) -> Any:
+    """Create the Blosc codec described by `compressor`, using bit-shuffling to expose the redundancy of bit planes."""
+    _validate_compressor(compressor, zarr_format=zarr_format)
+    cname, clevel = next(iter(compressor.items()))
+    from numcodecs import Blosc
+
+    return Blosc(cname=cname, clevel=clevel, shuffle=Blosc.BITSHUFFLE)
+
+
 def _read_multiscale(
     store: str | Path, raster_type: Literal["image", "labels"], reader_format: Format
 ) -> DataArray | DataTree:
@@ -74,7 +101,7 @@ def _read_multiscale(
     # This works for all versions as in zarr v3 the level of the 'ome' key is taken as root_attrs.
     omero_metadata = loaded_node.zarr.root_attrs.get("omero")
     # TODO: check if below is still valid
-    legacy_channels_metadata = node.load(Multiscales).zarr.root_attrs.get("channels_metadata", None)  # legacy v0.1
+    legacy_channels_metadata = loaded_node.zarr.root_attrs.get("channels_metadata", None)  # legacy v0.1
     assert len(multiscales) == 1
     # checking for multiscales[0]["coordinateTransformations"] would make fail
     # something that doesn't have coordinateTransformations in top level
@@ -90,10 +117,17 @@ def _read_multiscale(
         if omero_metadata is not None:
             channels = [d["label"] for d in omero_metadata["channels"]]
     axes = [i["name"] for i in node.metadata["axes"]]
+    # when parsing the metadata, ome-zarr already opened the arrays of all the resolution levels (in the order of the
+    # datasets), so we reuse them instead of opening (and parsing the metadata of) each Zarr array a second time
+    arrays = node.data
+    if len(arrays) != len(datasets):
+        raise ValueError(
+            f"Image location {image_loc} lists {len(datasets)} resolution levels in its multiscales metadata, but "
+            f"{len(arrays)} arrays were loaded. Element {image_loc.basename()} is potentially corrupted."
+        )
     if len(datasets) > 1:
         multiscale_image = {}
-        for i, d in enumerate(datasets):
-            data = node.load(Multiscales).array(resolution=d)
+        for i, data in enumerate(arrays):
             multiscale_image[f"scale{i}"] = Dataset(
                 {
                     "image": DataArray(
@@ -108,7 +142,7 @@ def _read_multiscale(
         _set_transformations(msi, transformations)
         return compute_coordinates(msi)
 
-    data = node.load(Multiscales).array(resolution=datasets[0])
+    data = arrays[0]
     si = DataArray(
         data,
         name="image",
@@ -154,6 +188,7 @@ def _write_raster(
     raster_format: RasterFormatType,
     storage_options: JSONDict | list[JSONDict] | None = None,
     label_metadata: JSONDict | None = None,
+    compressor: dict[Literal["lz4", "zstd"], int] | None = None,
     **metadata: str | JSONDict | list[JSONDict],
 ) -> None:
     """Write raster data to disk.
@@ -174,11 +209,24 @@ def _write_raster(
         Additional options for writing the raster data, like chunks and compression.
     label_metadata
         Label metadata which can only be defined when writing 'labels'.
+    compressor
+        Only usable with the Zarr v2 based raster formats (`RasterFormatV01`, `RasterFormatV02`); the default (Zarr v3)
+        raster format does not support it and a `ValueError` is raised. A dictionary with a single item mapping the
+        Blosc compression algorithm (`'lz4'` or `'zstd'`) to the compression level (0-9). If `None`, the default
+        compression of `ome-zarr` is used.
     metadata
         Additional metadata for the raster element
     """
     if raster_type not in ["image", "labels"]:
         raise ValueError(f"{raster_type} is not a valid raster type. Must be 'image' or 'labels'.")
+    if compressor is not None:
+        codec = _get_compressor(compressor, zarr_format=raster_format.zarr_format)
+        if storage_options is None:
+            storage_options = {"compressor": codec}
+        elif isinstance(storage_options, dict):
+            storage_options = {"compressor": codec, **storage_options}
+        else:
+            storage_options = [{"compressor": codec, **options} for options in storage_options]
     # "name" and "label_metadata" are only used for labels. "name" is written in write_multiscale_ngff() but ignored in
     # write_image_ngff() (possibly an ome-zarr-py bug). We only use "name" to ensure correct group access in the
     # ome-zarr API.
@@ -334,7 +382,12 @@ def _write_raster_datatree(
     chunks = get_pyramid_levels(raster_data, "chunks")
 
     parsed_axes = _get_valid_axes(axes=list(input_axes), fmt=raster_format)
-    storage_options = [{"chunks": chunk} for chunk in chunks]
+    if storage_options is None:
+        storage_options = [{"chunks": chunk} for chunk in chunks]
+    elif isinstance(storage_options, dict):
+        storage_options = [{"chunks": chunk, **storage_options} for chunk in chunks]
+    else:
+        storage_options = [{"chunks": chunk, **options} for chunk, options in zip(chunks, storage_options, strict=True)]
     ome_zarr_format = get_ome_zarr_format(raster_format)
     dask_delayed = write_multi_scale_ngff(
         pyramid=data,
@@ -366,6 +419,7 @@ def write_image(
     name: str,
     element_format: RasterFormatType = CurrentRasterFormat(),
     storage_options: JSONDict | list[JSONDict] | None = None,
+    compressor: dict[Literal["lz4", "zstd"], int] | None = None,
     **metadata: str | JSONDict | list[JSONDict],
 ) -> None:
     _write_raster(
@@ -375,6 +429,7 @@ def write_image(
         name=name,
         raster_format=element_format,
         storage_options=storage_options,
+        compressor=compressor,
         **metadata,
     )
 
@@ -386,6 +441,7 @@ def write_labels(
     element_format: RasterFormatType = CurrentRasterFormat(),
     storage_options: JSONDict | list[JSONDict] | None = None,
     label_metadata: JSONDict | None = None,
+    compressor: dict[Literal["lz4", "zstd"], int] | None = None,
     **metadata: JSONDict,
 ) -> None:
     _write_raster(
@@ -396,5 +452,6 @@ def write_labels(
         raster_format=element_format,
         storage_options=storage_options,
         label_metadata=label_metadata,
+        compressor=compressor,
         **metadata,
     )
@@ -8,6 +8,7 @@ import dask.dataframe as dd
 import geopandas
 import numpy as np
 import pandas as pd
+import shapely
 from anndata import AnnData
 from dask.dataframe import DataFrame as DaskDataFrame
 from geopandas import GeoDataFrame
@@ -321,11 +322,13 @@ def force_2d(gdf: GeoDataFrame) -> None:
         GeoDataFrame with 2D or 3D geometries
 
     """
+    # vectorized check, so that the common case of data that is already 2D does not loop over the geometries in Python
+    has_z = shapely.has_z(gdf.geometry.values)
+    if not has_z.any():
+        return
     new_shapes = []
-    any_3d = False
-    for shape in gdf.geometry:
-        if shape.has_z:
-            any_3d = True
+    for shape, shape_has_z in zip(gdf.geometry, has_z, strict=True):
+        if shape_has_z:
             if isinstance(shape, Point):
                 new_shape = Point(shape.x, shape.y)
             elif isinstance(shape, Polygon):
@@ -337,8 +340,7 @@ def force_2d(gdf: GeoDataFrame) -> None:
             new_shapes.append(new_shape)
         else:
             new_shapes.append(shape)
-    if any_3d:
-        gdf.geometry = new_shapes
+    gdf.geometry = new_shapes
 
 
 def get_raster_model_from_data_dims(dims: tuple[str, ...]) -> type[RasterSchema]:
@@ -2,9 +2,9 @@
 
 import warnings
 from collections.abc import Mapping, Sequence
-from functools import singledispatchmethod
+from functools import lru_cache, singledispatchmethod
 from pathlib import Path
-from typing import Any, Literal, TypeAlias
+from typing import Any, Literal, TypeAlias, TypeVar
 
 import dask.dataframe as dd
 import numpy as np
@@ -17,6 +17,7 @@ from geopandas import GeoDataFrame, GeoSeries
 from multiscale_spatial_image import to_multiscale
 from multiscale_spatial_image.to_multiscale.to_multiscale import Methods
 from pandas import CategoricalDtype
+from shapely import get_parts
 from shapely._geometry import GeometryType
 from shapely.geometry import MultiPolygon, Point, Polygon
 from shapely.geometry.collection import GeometryCollection
@@ -60,23 +61,57 @@ Transform_s = AttrSchema(BaseTransformation, None)
 ATTRS_KEY = "spatialdata_attrs"
 
 
+@lru_cache(maxsize=64)
+def _get_transpose_permutation(dims: tuple[str, ...], target_dims: tuple[str, ...]) -> tuple[int, ...]:
+    axes_rank = {d: i for i, d in enumerate(dims)}
+    return tuple(axes_rank[d] for d in target_dims)
+
+
+def _to_multiscale_nearest(data: DataArray, scale_factors: ScaleFactors_t, chunks: Chunks_t | None) -> DataTree:
+    """
+    Lazy equivalent of `to_multiscale(..., method=Methods.DASK_IMAGE_NEAREST)`.
+
+    `to_multiscale()` computes each level eagerly with an affine transformation of order 0 from `dask-image`. For
+    integer scale factors, nearest-neighbor downsampling samples the pixels `0, f, 2f, ...` of the previous level, which
+    is a strided selection that Dask builds with one slicing task per chunk and without computing any data.
+    """
+    if chunks is None:
+        # same defaults as to_multiscale()
+        chunks = dict.fromkeys(data.dims, 64 if Z in data.dims else 256)
+    current = data.chunk(chunks)
+    levels = {"scale0": current.to_dataset(name=data.name, promote_attrs=True)}
+    for i, scale_factor in enumerate(scale_factors):
+        if isinstance(scale_factor, int):
+            dim_factors = {dim: scale_factor for dim in current.dims if dim in (X, Y, Z)}
+        else:
+            dim_factors = scale_factor
+        selection = {}
+        for dim, factor in dim_factors.items():
+            size = current.sizes[dim] // factor
+            if size < 1:
+                raise ValueError(
+                    f"Scale factor {scale_factor} is incompatible with image shape {data.shape} along dimension "
+                    f"`{dim}`."
+                )
+            selection[dim] = slice(0, size * factor, factor)
+        current = current.isel(selection).chunk(chunks)
+        levels[f"scale{i + 1}"] = current.to_dataset(name=data.name, promote_attrs=True)
+    return DataTree.from_dict(levels)
+
+
 def _parse_transformations(element: SpatialElement, transformations: MappingToCoordinateSystem_t | None = None) -> None:
     _validate_mapping_to_coordinate_system_type(transformations)
     transformations_in_element = _get_transformations(element)
-    if (
-        transformations_in_element is not None
-        and len(transformations_in_element) > 0
-        and transformations is not None
-        and len(transformations) > 0
-    ):
+    if transformations_in_element and transformations:
         # we can relax this and overwrite the transformations using the one passed as argument
         raise ValueError(
             "Transformations are both specified for the element and also passed as an argument to the parser. Please "
             "specify the transformations only once."
         )
-    if transformations is not None and len(transformations) > 0:
+    # no copy is needed here: _set_transformations() stores a copy of the mapping
+    if transformations:
         parsed_transformations = transformations
-    elif transformations_in_element is not None and len(transformations_in_element) > 0:
+    elif transformations_in_element:
         parsed_transformations = transformations_in_element
     else:
         parsed_transformations = {DEFAULT_COORDINATE_SYSTEM: Identity()}
@@ -163,8 +198,6 @@ class RasterSchema(DataArraySchema):
         `dims` argument above. If `dims` is not specified, the dims are set to (c)(z)yx, dependent on the number of
         dimensions of the data.
         """
-        if transformations:
-            transformations = transformations.copy()
         if "name" in kwargs:
             raise ValueError("The `name` argument is not (yet) supported for raster data.")
         # if dims is specified inside the data, get the value of dims from the data
@@ -181,17 +214,13 @@ class RasterSchema(DataArraySchema):
             # but if dims don't match the model's dims, throw error
             if set(dims).symmetric_difference(cls.dims.dims):
                 raise ValueError(f"Wrong `dims`: {dims}. Expected {cls.dims.dims}.")
-            _reindex = lambda d: d
         # if there are no dims in the data, use the model's dims or provided dims
         elif isinstance(data, np.ndarray | DaskArray):
-            if not isinstance(data, DaskArray):  # numpy -> dask
-                data = from_array(data)
             if dims is None:
                 dims = cls.dims.dims
             else:
                 if len(set(dims).symmetric_difference(cls.dims.dims)) > 0:
                     raise ValueError(f"Wrong `dims`: {dims}. Expected {cls.dims.dims}.")
-            _reindex = lambda d: dims.index(d)
         else:
             raise ValueError(f"Unsupported data type: {type(data)}.")
 
@@ -200,8 +229,8 @@ class RasterSchema(DataArraySchema):
             try:
                 if isinstance(data, DataArray):
                     data = data.transpose(*list(cls.dims.dims))
-                elif isinstance(data, DaskArray):
-                    data = data.transpose(*[_reindex(d) for d in cls.dims.dims])
+                elif isinstance(data, np.ndarray | DaskArray):
+                    data = data.transpose(*_get_transpose_permutation(tuple(dims), cls.dims.dims))
                 else:
                     raise ValueError(f"Unsupported data type: {type(data)}.")
             except ValueError as e:
@@ -209,6 +238,10 @@ class RasterSchema(DataArraySchema):
                     f"Cannot transpose arrays to match `dims`: {dims}.",
                     "Try to reshape `data` or `dims`.",
                 ) from e
+        # numpy -> dask; this is done after transposing (a view for numpy arrays), so that the chunks are chosen for the
+        # final axes order and no transpose layer is added to the Dask graph
+        if isinstance(data, np.ndarray):
+            data = from_array(data)
 
         # finally convert to spatial image
         if c_coords is not None:
@@ -232,14 +265,17 @@ class RasterSchema(DataArraySchema):
                 chunks = {dim: chunks[index] for index, dim in enumerate(data.dims)}
             if isinstance(chunks, float):
                 chunks = {dim: chunks for index, dim in data.dims}
-            data = to_multiscale(
-                data,
-                scale_factors=scale_factors,
-                method=method,
-                chunks=chunks,
-            )
+            if method == Methods.DASK_IMAGE_NEAREST:
+                data = _to_multiscale_nearest(data, scale_factors=scale_factors, chunks=chunks)
+            else:
+                data = to_multiscale(
+                    data,
+                    scale_factors=scale_factors,
+                    method=method,
+                    chunks=chunks,
+                )
             _parse_transformations(data, parsed_transform)
-        cls()._check_chunk_size_not_too_large(data)
+        _get_schema_instance(cls)._check_chunk_size_not_too_large(data)
         # recompute coordinates for (multiscale) spatial image
         return compute_coordinates(data)
 
@@ -271,15 +307,21 @@ class RasterSchema(DataArraySchema):
 
     @validate.register(DataTree)
     def _(self, data: DataTree) -> None:
-        for j, k in zip(data.keys(), [f"scale{i}" for i in np.arange(len(data.keys()))], strict=True):
-            if j != k:
-                raise ValueError(f"Wrong key for multiscale data, found: `{j}`, expected: `{k}`.")
-        name = {list(data[i].data_vars.keys())[0] for i in data}
-        if len(name) != 1:
-            raise ValueError(f"Expected exactly one data variable for the datatree: found `{name}`.")
-        name = list(name)[0]
-        for d in data:
-            super().validate(data[d][name])
+        # single pass over the scales: the keys, the name of the data variable and each scale are checked together
+        if len(data) == 0:
+            raise ValueError("Expected exactly one data variable for the datatree: found no scales.")
+        name: str | None = None
+        for i, (j, node) in enumerate(data.items()):
+            if j != f"scale{i}":
+                raise ValueError(f"Wrong key for multiscale data, found: `{j}`, expected: `scale{i}`.")
+            node_name = next(iter(node.data_vars), None)
+            if node_name is None:
+                raise ValueError(f"Expected exactly one data variable for the datatree: found none in `{j}`.")
+            if name is None:
+                name = node_name
+            elif node_name != name:
+                raise ValueError(f"Expected exactly one data variable for the datatree: found `{ {name, node_name} }`.")
+            super().validate(node[name])
         self._check_chunk_size_not_too_large(data)
         self._check_transforms_present(data)
 
@@ -461,7 +503,7 @@ class ShapesModel:
             radii = data[cls.RADIUS_KEY].values
             if np.any(radii <= 0):
                 raise ValueError("Radii of circles must be positive.")
-            if np.any(np.isnan(radii)) or np.any(np.isinf(radii)):
+            if not np.isfinite(radii).all():
                 # using logger.warning instead of warnings.warn to avoid the warning to being silenced in some cases
                 # (e.g. PyCharm console)
                 logger.warning(
@@ -603,7 +645,8 @@ class ShapesModel:
         gc: GeometryCollection = from_geojson(data.read_bytes(), **kwargs)
         if not isinstance(gc, GeometryCollection):
             raise ValueError(f"`{data}` does not contain a `GeometryCollection`.")
-        geo_df = GeoDataFrame({"geometry": gc.geoms})
+        # get_parts() extracts the geometries as an array in C, instead of iterating over gc.geoms in Python
+        geo_df = GeoDataFrame({"geometry": get_parts(gc)})
         if isinstance(geo_df["geometry"].iloc[0], Point):
             if radius is None:
                 raise ValueError("If `geometry` is `Circles`, `radius` must be provided.")
@@ -818,7 +861,10 @@ class PointsModel:
                 table[feature_key] = feature_categ
         elif isinstance(data, dd.DataFrame):
             table = data[[coordinates[ax] for ax in axes]]
-            table.columns = axes
+            # renaming adds a node to the Dask expression even when the names are unchanged; in the common case the
+            # coordinates columns are already called (and ordered as) the axes, so the renaming is skipped
+            if list(table.columns) != axes:
+                table.columns = axes
             if feature_key is not None:
                 if data[feature_key].dtype.name == "category":
                     table[feature_key] = data[feature_key]
@@ -868,14 +914,15 @@ class PointsModel:
         transformations: MappingToCoordinateSystem_t | None = None,
     ) -> DaskDataFrame:
         assert isinstance(data, dd.DataFrame)
-        if feature_key is not None or instance_key is not None:
-            data.attrs[ATTRS_KEY] = {}
+        points_attrs: dict[str, str] = {}
         if feature_key is not None:
             assert feature_key in data.columns
-            data.attrs[ATTRS_KEY][cls.FEATURE_KEY] = feature_key
+            points_attrs[cls.FEATURE_KEY] = feature_key
         if instance_key is not None:
             assert instance_key in data.columns
-            data.attrs[ATTRS_KEY][cls.INSTANCE_KEY] = instance_key
+            points_attrs[cls.INSTANCE_KEY] = instance_key
+        if points_attrs:
+            data.attrs[ATTRS_KEY] = points_attrs
 
         for c in data.columns:
             #  Here we are explicitly importing the categories
@@ -966,7 +1013,7 @@ class TableModel:
         """
         attrs = data.uns.get(ATTRS_KEY)
         if attrs is None:
-            data.uns[ATTRS_KEY] = {}
+            data.uns[ATTRS_KEY] = attrs = {}
 
         if not instance_key:
             if not attrs.get(TableModel.INSTANCE_KEY):
@@ -1141,9 +1188,6 @@ class TableModel:
                 f" argument(s). However, `adata.uns[{cls.ATTRS_KEY!r}]` has already been set."
             )
 
-        if cls.ATTRS_KEY not in adata.uns:
-            adata.uns[cls.ATTRS_KEY] = {}
-
         if region is None:
             raise ValueError(f"`{cls.REGION_KEY}` must be provided.")
         if region_key is None:
@@ -1154,13 +1198,16 @@ class TableModel:
         if isinstance(region, np.ndarray):
             region = region.tolist()
         region_: list[str] = region if isinstance(region, list) else [region]
-        if not adata.obs[region_key].isin(region_).all():
+        region_column = adata.obs[region_key]
+        # fast path: for categorical columns without missing values it is enough to check the categories
+        values_match = (
+            isinstance(region_column.dtype, pd.CategoricalDtype)
+            and set(region_column.cat.categories).issubset(region_)
+            and not region_column.hasnans
+        ) or region_column.isin(region_).all()
+        if not values_match:
             raise ValueError(f"`adata.obs[{region_key}]` values do not match with `{cls.REGION_KEY}` values.")
 
-        adata.uns[cls.ATTRS_KEY][cls.REGION_KEY] = region
-        adata.uns[cls.ATTRS_KEY][cls.REGION_KEY_KEY] = region_key
-        adata.uns[cls.ATTRS_KEY][cls.INSTANCE_KEY] = instance_key
-
         # note! this is an expensive check and therefore we skip it during validation
         # https://github.com/scverse/spatialdata/issues/715
         grouped = adata.obs.groupby(region_key, observed=True)
@@ -1172,12 +1219,12 @@ class TableModel:
                 f"Instance key column for region(s) `{', '.join(not_unique)}` does not contain only unique values"
             )
 
-        attr = {
-            "region": region,
-            "region_key": region_key,
-            "instance_key": instance_key,
+        # the metadata is written once, after all the checks have passed
+        adata.uns[cls.ATTRS_KEY] = {
+            cls.REGION_KEY: region,
+            cls.REGION_KEY_KEY: region_key,
+            cls.INSTANCE_KEY: instance_key,
         }
-        adata.uns[cls.ATTRS_KEY] = attr
         convert_region_column_to_categorical(adata)
         cls().validate(adata)
         return adata
@@ -1194,6 +1241,20 @@ Schema_t: TypeAlias = (
 )
 
 
+_S = TypeVar("_S")
+
+# the models hold no per-call state, so one instance per model is shared by the validation calls instead of rebuilding
+# the (xarray-)schema objects every time
+_schema_instances: dict[type, Any] = {}
+
+
+def _get_schema_instance(schema: type[_S]) -> _S:
+    instance: _S | None = _schema_instances.get(schema)
+    if instance is None:
+        instance = _schema_instances[schema] = schema()
+    return instance
+
+
 def get_model(
     e: SpatialElement,
 ) -> Schema_t:
@@ -1214,7 +1275,7 @@ def get_model(
         schema: Schema_t,
         e: SpatialElement,
     ) -> Schema_t:
-        schema().validate(e)
+        _get_schema_instance(schema).validate(e)
         return schema
 
     if isinstance(e, DataArray | DataTree):
@@ -40,20 +40,18 @@ def _get_transformations(e: SpatialElement) -> MappingToCoordinateSystem_t | Non
 def _set_transformations_to_dict_container(dict_container: Any, transformations: MappingToCoordinateSystem_t) -> None:
     from spatialdata.models._utils import TRANSFORM_KEY
 
-    if TRANSFORM_KEY not in dict_container:
-        dict_container[TRANSFORM_KEY] = {}
     # this modifies the dict in place without triggering a setter in the element class. Probably we want to stop using
     # _set_transformations_to_dict_container and use _set_transformations_to_element instead
-    dict_container[TRANSFORM_KEY] = transformations
+    # a (shallow) copy is stored, so that the element does not alias the mapping of the caller, which may be modified
+    # afterwards or shared with other elements (e.g. when parsing multiple elements with the same transformations)
+    dict_container[TRANSFORM_KEY] = dict(transformations)
 
 
 def _set_transformations_to_element(element: Any, transformations: MappingToCoordinateSystem_t) -> None:
     from spatialdata.models._utils import TRANSFORM_KEY
 
-    attrs = element.attrs
-    if TRANSFORM_KEY not in attrs:
-        attrs[TRANSFORM_KEY] = {}
-    attrs[TRANSFORM_KEY] = transformations
+    # a (shallow) copy is stored, see _set_transformations_to_dict_container()
+    element.attrs[TRANSFORM_KEY] = dict(transformations)
 
 
 @singledispatch
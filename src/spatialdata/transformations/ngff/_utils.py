@@ -1,5 +1,3 @@
-import copy
-
 from spatialdata.models import C, X, Y, Z
 from spatialdata.transformations.ngff.ngff_coordinate_system import NgffAxis, NgffCoordinateSystem
 
@@ -48,13 +46,13 @@ def get_default_coordinate_system(dims: tuple[str, ...]) -> NgffCoordinateSystem
     axes = []
     for c in dims:
         if c == X:
-            axes.append(copy.deepcopy(x_axis))
+            axes.append(x_axis.copy())
         elif c == Y:
-            axes.append(copy.deepcopy(y_axis))
+            axes.append(y_axis.copy())
         elif c == Z:
-            axes.append(copy.deepcopy(z_axis))
+            axes.append(z_axis.copy())
         elif c == C:
-            axes.append(copy.deepcopy(c_axis))
+            axes.append(c_axis.copy())
         else:
             raise ValueError(f"Invalid dimension: {c}")
     return NgffCoordinateSystem(name="".join(dims), axes=axes)
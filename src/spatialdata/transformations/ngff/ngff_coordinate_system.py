@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 import json
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -49,6 +48,10 @@ class NgffAxis:
             return False
         return self.to_dict() == other.to_dict()
 
+    def copy(self) -> NgffAxis:
+        """Return a copy of the axis (cheaper than `copy.deepcopy()`)."""
+        return NgffAxis(name=self.name, type=self.type, unit=self.unit)
+
 
 class NgffCoordinateSystem:
     """
@@ -121,6 +124,10 @@ class NgffCoordinateSystem:
             return False
         return self.to_dict() == other.to_dict()
 
+    def copy(self) -> NgffCoordinateSystem:
+        """Return a copy of the coordinate system and of its axes (cheaper than `copy.deepcopy()`)."""
+        return NgffCoordinateSystem(name=self.name, axes=[axis.copy() for axis in self._axes])
+
     def equal_up_to_the_units(self, other: NgffCoordinateSystem) -> bool:
         """Check if two coordinate systems are the same based on the axes' names and types (ignoring the units)."""
         if self.name != other.name:
@@ -154,7 +161,7 @@ class NgffCoordinateSystem:
         -------
         a new CoordinateSystem with the subset axes
         """
-        axes = [copy.deepcopy(axis) for axis in self._axes if axis.name in axes_names]
+        axes = [axis.copy() for axis in self._axes if axis.name in axes_names]
         if new_name is None:
             new_name = self.name + "_subset " + str(axes_names)
         return NgffCoordinateSystem(name=new_name, axes=axes)
@@ -212,7 +219,7 @@ class NgffCoordinateSystem:
         for axis_name in common_axes:
             if coord_sys1.get_axis(axis_name) != coord_sys2.get_axis(axis_name):
                 raise ValueError("Common axes are not identical")
-        axes = copy.deepcopy(coord_sys1._axes)
+        axes = [axis.copy() for axis in coord_sys1._axes]
         for axis in coord_sys2._axes:
             if axis.name not in common_axes:
                 axes.append(axis)
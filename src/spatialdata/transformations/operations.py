@@ -7,6 +7,7 @@ import networkx as nx
 import numpy as np
 from dask.dataframe import DataFrame as DaskDataFrame
 from geopandas import GeoDataFrame
+from shapely import get_coordinates
 from skimage.transform import estimate_transform
 
 from spatialdata._logging import logger
@@ -196,8 +197,8 @@ def remove_transformation(
 def _build_transformations_graph(sdata: SpatialData) -> nx.Graph:
     g = nx.DiGraph()
     gen = sdata._gen_spatial_element_values()
-    for cs in sdata.coordinate_systems:
-        g.add_node(cs)
+    # the coordinate system nodes are added together with the edges, so that the transformations of each element are
+    # retrieved only once (sdata.coordinate_systems would require an additional pass over all the elements)
     for e in gen:
         g.add_node(id(e))
         transformations = get_transformation(e, get_all=True)
@@ -248,20 +249,13 @@ def get_transformation_between_coordinate_systems(
         return Identity()
 
     def _describe_paths(paths: list[list[int | str]]) -> str:
+        element_descriptions = {
+            id(e): f"<sdata>.{element_type}[{element_name!r}]"
+            for element_type, element_name, e in sdata._gen_elements()
+        }
         paths_str = ""
         for p in paths:
-            components = []
-            for c in p:
-                if isinstance(c, str):
-                    components.append(f"{c!r}")
-                    continue
-                ss = [
-                    f"<sdata>.{element_type}[{element_name!r}]"
-                    for element_type, element_name, e in sdata._gen_elements()
-                    if id(e) == c
-                ]
-                assert len(ss) == 1
-                components.append(ss[0])
+            components = [f"{c!r}" if isinstance(c, str) else element_descriptions[c] for c in p]
             paths_str += "\n    " + " -> ".join(components)
         return paths_str
 
@@ -291,7 +285,8 @@ def get_transformation_between_coordinate_systems(
         if len(paths_with_length_1) == 1:
             path = paths_with_length_1[0]
         elif shortest_path:
-            shortest_paths = [p for p in paths if len(p) == min(map(len, paths))]
+            min_length = min(map(len, paths))
+            shortest_paths = [p for p in paths if len(p) == min_length]
 
             if len(shortest_paths) > 1:
                 # error 1
@@ -318,7 +313,8 @@ def get_transformation_between_coordinate_systems(
         if len(paths) == 1:
             path = paths[0]
         elif shortest_path:
-            shortest_paths = [p for p in paths if len(p) == min(map(len, paths))]
+            min_length = min(map(len, paths))
+            shortest_paths = [p for p in paths if len(p) == min_length]
             if len(shortest_paths) > 1:
                 # error 4
                 s = _describe_paths(shortest_paths)
@@ -373,67 +369,44 @@ def get_transformation_between_landmarks(
     >>> references_coords = PointsModel(points_reference)
     >>> transformation = get_transformation_between_landmarks(references_coords, moving_coords)
     """
-    from spatialdata import transform
     from spatialdata.models import get_axes_names
-    from spatialdata.transformations.transformations import Affine, Sequence
+    from spatialdata.transformations.transformations import Affine
 
     assert get_axes_names(references_coords) == ("x", "y")
     assert get_axes_names(moving_coords) == ("x", "y")
 
     if isinstance(references_coords, GeoDataFrame):
-        references_xy = np.stack([references_coords.geometry.x, references_coords.geometry.y], axis=1)
-        moving_xy = np.stack([moving_coords.geometry.x, moving_coords.geometry.y], axis=1)
+        references_xy = get_coordinates(references_coords.geometry)
+        moving_xy = get_coordinates(moving_coords.geometry)
     elif isinstance(references_coords, DaskDataFrame):
         references_xy = references_coords[["x", "y"]].to_dask_array().compute()
         moving_xy = moving_coords[["x", "y"]].to_dask_array().compute()
     else:
         raise TypeError("references_coords must be either an GeoDataFrame or a DaskDataFrame")
 
-    model = estimate_transform("affine", src=moving_xy, dst=references_xy)
-    transform_matrix = model.params
-    a = transform_matrix[:2, :2]
-    d = np.linalg.det(a)
-    final: BaseTransformation
+    # the sign of the determinant of the least-squares affine fit is the sign of the determinant of the
+    # cross-covariance of the landmarks (the covariance of the moving landmarks being positive definite), so it is
+    # computed directly instead of estimating an affine transformation only to check for a flip
+    d = np.linalg.det((references_xy - references_xy.mean(axis=0)).T @ (moving_xy - moving_xy.mean(axis=0)))
     if d < 0:
         m = (moving_xy[:, 0].max() - moving_xy[:, 0].min()) / 2
-        flip = Affine(
-            np.array(
-                [
-                    [-1, 0, 2 * m],
-                    [0, 1, 0],
-                    [0, 0, 1],
-                ]
-            ),
-            input_axes=("x", "y"),
-            output_axes=("x", "y"),
+        flip = np.array(
+            [
+                [-1, 0, 2 * m],
+                [0, 1, 0],
+                [0, 0, 1],
+            ]
         )
-        FLIPPED_COORDINATE_SYSTEM = "__flipped__"
-        transformations = get_transformation(moving_coords, get_all=True)
-        assert isinstance(transformations, dict)
-        if FLIPPED_COORDINATE_SYSTEM in transformations:
-            raise RuntimeError(
-                f"The coordinate system {FLIPPED_COORDINATE_SYSTEM!r} already exists in the moving element."
-            )
-        transformations[FLIPPED_COORDINATE_SYSTEM] = flip
-        flipped_moving = transform(moving_coords, to_coordinate_system=FLIPPED_COORDINATE_SYSTEM)
-        if isinstance(flipped_moving, GeoDataFrame):
-            flipped_moving_xy = np.stack([flipped_moving.geometry.x, flipped_moving.geometry.y], axis=1)
-        elif isinstance(flipped_moving, DaskDataFrame):
-            flipped_moving_xy = flipped_moving[["x", "y"]].to_dask_array().compute()
-        else:
-            raise TypeError("flipped_moving must be either an GeoDataFrame or a DaskDataFrame")
+        # the flip is applied to the landmark coordinates directly, without transforming the moving element
+        flipped_moving_xy = moving_xy * np.array([-1, 1]) + np.array([2 * m, 0])
         model = estimate_transform("similarity", src=flipped_moving_xy, dst=references_xy)
-        final = Sequence([flip, Affine(model.params, input_axes=("x", "y"), output_axes=("x", "y"))])
-        del transformations[FLIPPED_COORDINATE_SYSTEM]
+        # the flip followed by the similarity, composed directly as a single matrix
+        matrix = model.params @ flip
     else:
         model = estimate_transform("similarity", src=moving_xy, dst=references_xy)
-        final = Affine(model.params, input_axes=("x", "y"), output_axes=("x", "y"))
+        matrix = model.params
 
-    affine = Affine(
-        final.to_affine_matrix(input_axes=("x", "y"), output_axes=("x", "y")),
-        input_axes=("x", "y"),
-        output_axes=("x", "y"),
-    )
+    affine = Affine(matrix, input_axes=("x", "y"), output_axes=("x", "y"))
     return affine
 
 
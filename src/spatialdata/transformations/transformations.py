@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 from warnings import warn
 
@@ -193,12 +194,7 @@ class Identity(BaseTransformation):
         self.validate_axes(output_axes)
         if not all(ax in output_axes for ax in input_axes):
             raise ValueError("Input axes must be a subset of output axes.")
-        m = self._empty_affine_matrix(input_axes, output_axes)
-        for i_out, ax_out in enumerate(output_axes):
-            for i_in, ax_in in enumerate(input_axes):
-                if ax_in == ax_out:
-                    m[i_out, i_in] = 1
-        return m
+        return _get_axes_injection_matrix(tuple(input_axes), tuple(output_axes)).copy()
 
     def inverse(self) -> BaseTransformation:
         return self
@@ -357,13 +353,10 @@ class Translation(BaseTransformation):
         self.validate_axes(output_axes)
         if not all(ax in output_axes for ax in input_axes):
             raise ValueError("Input axes must be a subset of output axes.")
-        m = self._empty_affine_matrix(input_axes, output_axes)
+        m = _get_axes_injection_matrix(tuple(input_axes), tuple(output_axes)).copy()
         for i_out, ax_out in enumerate(output_axes):
-            for i_in, ax_in in enumerate(input_axes):
-                if ax_in == ax_out:
-                    m[i_out, i_in] = 1
-                    if ax_out in self.axes:
-                        m[i_out, -1] = self.translation[self.axes.index(ax_out)]
+            if ax_out in self.axes and ax_out in input_axes:
+                m[i_out, -1] = self.translation[self.axes.index(ax_out)]
         return m
 
     def to_translation_vector(self, axes: tuple[ValidAxis_t, ...]) -> ArrayLike:
@@ -444,12 +437,10 @@ class Scale(BaseTransformation):
         self.validate_axes(output_axes)
         if not all(ax in output_axes for ax in input_axes):
             raise ValueError("Input axes must be a subset of output axes.")
-        m = self._empty_affine_matrix(input_axes, output_axes)
+        m = _get_axes_injection_matrix(tuple(input_axes), tuple(output_axes)).copy()
         for i_out, ax_out in enumerate(output_axes):
-            for i_in, ax_in in enumerate(input_axes):
-                if ax_in == ax_out:
-                    scale_factor = self.scale[self.axes.index(ax_out)] if ax_out in self.axes else 1
-                    m[i_out, i_in] = scale_factor
+            if ax_out in self.axes and ax_out in input_axes:
+                m[i_out, input_axes.index(ax_out)] = self.scale[self.axes.index(ax_out)]
         return m
 
     def to_scale_vector(self, axes: tuple[ValidAxis_t, ...]) -> ArrayLike:
@@ -554,16 +545,18 @@ class Affine(BaseTransformation):
                 stacklevel=2,
             )
         m = self._empty_affine_matrix(input_axes, output_axes)
+        # positions of the axes in the matrix, computed once instead of once per (output axis, input axis) pair
+        self_input_index = {ax: j for j, ax in enumerate(self.input_axes)}
+        self_output_index = {ax: j for j, ax in enumerate(self.output_axes)}
         for i_out, ax_out in enumerate(output_axes):
-            for i_in, ax_in in enumerate(input_axes):
-                if ax_out in self.output_axes:
-                    j_out = self.output_axes.index(ax_out)
-                    if ax_in in self.input_axes:
-                        j_in = self.input_axes.index(ax_in)
-                        m[i_out, i_in] = self.matrix[j_out, j_in]
-                    m[i_out, -1] = self.matrix[j_out, -1]
-                elif ax_in == ax_out:
-                    m[i_out, i_in] = 1
+            if ax_out in self_output_index:
+                j_out = self_output_index[ax_out]
+                for i_in, ax_in in enumerate(input_axes):
+                    if ax_in in self_input_index:
+                        m[i_out, i_in] = self.matrix[j_out, self_input_index[ax_in]]
+                m[i_out, -1] = self.matrix[j_out, -1]
+            elif ax_out in input_axes:
+                m[i_out, input_axes.index(ax_out)] = 1
         return m
 
     def _repr_transformation_description(self, indent: int = 0) -> str:
@@ -756,6 +749,22 @@ class Sequence(BaseTransformation):
         return self.transformations == other.transformations
 
 
+@lru_cache(maxsize=256)
+def _get_axes_injection_matrix(input_axes: tuple[ValidAxis_t, ...], output_axes: tuple[ValidAxis_t, ...]) -> ArrayLike:
+    """
+    Get the affine matrix mapping each input axis to the output axis with the same name.
+
+    The result only depends on the axes, so it is cached; it is read-only and callers must copy it before modifying it.
+    """
+    m = BaseTransformation._empty_affine_matrix(input_axes, output_axes)
+    for i_out, ax_out in enumerate(output_axes):
+        for i_in, ax_in in enumerate(input_axes):
+            if ax_in == ax_out:
+                m[i_out, i_in] = 1
+    m.flags.writeable = False
+    return m
+
+
 def _get_current_output_axes(
     transformation: BaseTransformation, input_axes: tuple[ValidAxis_t, ...]
 ) -> tuple[ValidAxis_t, ...]:
@@ -172,6 +172,43 @@ def test_transform_raster(full_sdata: SpatialData, element_type: str, multiscale
     #  should be done after https://github.com/scverse/spatialdata/issues/165 is fixed to have better results
 
 
+@pytest.mark.parametrize("multiscale", [False, True])
+def test_transform_raster_translation_does_not_resample(full_sdata: SpatialData, multiscale: bool):
+    datatype = DataTree if multiscale else DataArray
+    image = next(v for v in full_sdata.images.values() if isinstance(v, datatype))
+    translation = Translation([10, 20], axes=("x", "y"))
+    set_transformation(image, Sequence([get_transformation(image), translation]), "translated")
+
+    transformed = transform(image, to_coordinate_system="translated")
+
+    # the data is not resampled, the translation is kept in the transformation
+    if multiscale:
+        for k in image:
+            assert transformed[k]["image"].data is image[k]["image"].data
+    else:
+        assert transformed.data is image.data
+    assert np.allclose(
+        get_transformation(transformed, "translated").to_affine_matrix(("x", "y"), ("x", "y")),
+        translation.to_affine_matrix(("x", "y"), ("x", "y")),
+    )
+
+
+@pytest.mark.parametrize("multiscale", [False, True])
+def test_transform_labels_are_not_interpolated(full_sdata: SpatialData, multiscale: bool):
+    datatype = DataTree if multiscale else DataArray
+    labels = next(v for v in full_sdata.labels.values() if isinstance(v, datatype))
+    set_transformation(labels, Sequence([get_transformation(labels), _get_affine()]), "transformed")
+
+    transformed = transform(labels, to_coordinate_system="transformed")
+
+    # nearest neighbor resampling: only the original label values (and the 0 padding) are present
+    scales = list(labels) if multiscale else [None]
+    for k in scales:
+        before = labels[k]["image"] if multiscale else labels
+        after = transformed[k]["image"] if multiscale else transformed
+        assert set(np.unique(after.data.compute())).issubset(set(np.unique(before.data.compute())) | {0})
+
+
 # TODO: maybe add methods for comparing the coordinates of elements so the below code gets less verbose
 def test_transform_points(points: SpatialData):
     affine = _get_affine()
@@ -204,6 +241,31 @@ def test_transform_points(points: SpatialData):
             assert np.allclose(x0, x1)
 
 
+def test_transform_points_is_lazy(points: SpatialData):
+    from dask.callbacks import Callback
+
+    element = points.points["points_0"]
+    set_transformation(element, Scale([2, 3], axes=("x", "y")), "scaled")
+
+    n_computes = 0
+
+    class CountComputes(Callback):
+        def _start(self, dsk):
+            nonlocal n_computes
+            n_computes += 1
+
+    with CountComputes():
+        transformed = transform(element, to_coordinate_system="scaled")
+    assert n_computes == 0
+
+    axes = list(get_axes_names(element))
+    assert transformed.columns.tolist() == [c for c in element.columns if c not in axes] + axes
+    original = element.compute()
+    computed = transformed.compute()
+    assert np.allclose(computed["x"], original["x"] * 2)
+    assert np.allclose(computed["y"], original["y"] * 3)
+
+
 def test_transform_shapes(shapes: SpatialData):
     affine = _get_affine()
 
@@ -229,6 +291,24 @@ def test_transform_shapes(shapes: SpatialData):
         assert geom_almost_equals(p0["geometry"], p1["geometry"])
 
 
+def test_transform_shapes_does_not_modify_input(shapes: SpatialData):
+    circles = shapes.shapes["circles"]
+    circles["value"] = np.arange(len(circles), dtype=float)
+    original = circles.copy(deep=True)
+    set_transformation(circles, Scale([2, 3], axes=("x", "y")), "scaled")
+
+    transformed = transform(circles, to_coordinate_system="scaled")
+
+    assert not geom_almost_equals(transformed.geometry, circles.geometry)
+    assert geom_almost_equals(circles.geometry, original.geometry)
+    assert circles["radius"].equals(original["radius"])
+    assert set(get_transformation(circles, get_all=True)) == {"global", "scaled"}
+
+    # in-place edits of the transformed element do not reach the input
+    transformed.loc[transformed.index[0], ["radius", "value"]] = -1.0
+    assert circles.equals(original)
+
+
 def test_map_coordinate_systems_single_path(full_sdata: SpatialData):
     scale = Scale([2], axes=("x",))
     translation = Translation([100], axes=("x",))
@@ -33,6 +33,19 @@ def test_labels_2d_to_circles(is_multiscale: bool) -> None:
     assert 7 not in new_circles.index
 
 
+def test_chunked_labels_2d_to_circles() -> None:
+    element = sdata["blobs_labels"].copy()
+    element.data = element.data.rechunk((100, 150))
+    chunks_circles = to_circles(element)
+    no_chunks_circles = to_circles(sdata["blobs_labels"])
+
+    unique, counts = np.unique(sdata["blobs_labels"].compute().data, return_counts=True)
+    assert np.array_equal(chunks_circles.index, unique[1:])
+    assert np.allclose(chunks_circles.radius, np.sqrt(counts[1:] / np.pi))
+    assert np.allclose(chunks_circles.geometry.x, no_chunks_circles.geometry.x)
+    assert np.allclose(chunks_circles.geometry.y, no_chunks_circles.geometry.y)
+
+
 @pytest.mark.parametrize("is_multiscale", [False, True])
 def test_labels_2d_to_polygons(is_multiscale: bool) -> None:
     key = "blobs" + ("_multiscale" if is_multiscale else "") + "_labels"
@@ -171,3 +184,9 @@ def test_vectorize_mask_almost_invertible() -> None:
 def test_label_column_vectorize_mask() -> None:
     assert "label" in _vectorize_mask(np.array([0]))
     assert "label" in _vectorize_mask(np.array([[0, 1], [1, 1]]))
+
+
+def test_vectorize_mask_without_positive_labels() -> None:
+    gdf = _vectorize_mask(np.array([[0, -1], [-1, -1]]))
+    assert "label" in gdf
+    assert len(gdf) == 0
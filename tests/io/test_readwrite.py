@@ -7,6 +7,7 @@ from typing import Any
 
 import dask.dataframe as dd
 import numpy as np
+import pandas as pd
 import pytest
 import zarr
 from anndata import AnnData
@@ -15,15 +16,20 @@ from zarr.errors import GroupNotFoundError
 
 from spatialdata import SpatialData, deepcopy, read_zarr
 from spatialdata._core.validation import ValidationError
+from spatialdata._io import write_image
 from spatialdata._io._utils import _are_directories_identical, get_dask_backing_files
 from spatialdata._io.format import (
+    CurrentRasterFormat,
     CurrentSpatialDataContainerFormat,
+    RasterFormatV02,
     SpatialDataContainerFormats,
     SpatialDataContainerFormatType,
     SpatialDataContainerFormatV01,
+    get_ome_zarr_format,
 )
+from spatialdata._io.io_raster import _read_multiscale
 from spatialdata.datasets import blobs
-from spatialdata.models import Image2DModel
+from spatialdata.models import Image2DModel, PointsModel
 from spatialdata.models._utils import get_channel_names
 from spatialdata.testing import assert_spatial_data_objects_are_identical
 from spatialdata.transformations.operations import (
@@ -62,6 +68,29 @@ class TestReadWrite:
         sdata = SpatialData.read(tmpdir)
         assert_spatial_data_objects_are_identical(images, sdata)
 
+    def test_raster_compressor(
+        self,
+        tmp_path: str,
+        images: SpatialData,
+        sdata_container_format: SpatialDataContainerFormatType,
+    ) -> None:
+        tmpdir = Path(tmp_path) / "tmp.zarr"
+        if sdata_container_format.zarr_format == 3:
+            with pytest.raises(ValueError, match="only supported for raster formats based on Zarr v2"):
+                images.write(tmpdir, sdata_formats=sdata_container_format, compressor={"zstd": 3})
+            # the compressor is rejected before anything is written
+            assert not tmpdir.exists()
+            return
+
+        images.write(tmpdir, sdata_formats=sdata_container_format, compressor={"zstd": 3})
+        for name in ["image2d", "image2d_multiscale"]:
+            group = zarr.open_group(tmpdir / "images" / name, mode="r")
+            for _, array in group.arrays():
+                assert array.metadata.compressor.cname == "zstd"
+                assert array.metadata.compressor.clevel == 3
+        sdata = SpatialData.read(tmpdir)
+        assert_spatial_data_objects_are_identical(images, sdata)
+
     def test_labels(
         self,
         tmp_path: str,
@@ -331,6 +360,9 @@ class TestReadWrite:
 
             sdata2 = SpatialData.read(f)
             assert len(get_dask_backing_files(sdata2)) > 0
+            # the number of rows of lazily loaded points is shown in the repr
+            element = next(iter(sdata2.points.values()))
+            assert f"with shape: ({len(element)}, " in repr(sdata2)
 
     def test_io_and_lazy_loading_raster(self, images, labels, sdata_container_format: SpatialDataContainerFormatType):
         sdatas = {"images": images, "labels": labels}
@@ -545,6 +577,47 @@ def test_bug_rechunking_after_queried_raster():
         queried.write(f)
 
 
+@pytest.mark.parametrize("per_level", [False, True])
+def test_write_multiscale_storage_options(tmp_path: Path, images: SpatialData, per_level: bool) -> None:
+    # the storage options passed by the user are merged with the chunks of each pyramid level (default raster format)
+    image = images["image2d_multiscale"]
+    chunks = [(3, 32, 32), (3, 16, 16), (3, 8, 8)]
+    storage_options = [{"chunks": chunk} for chunk in chunks] if per_level else {"chunks": (3, 8, 8)}
+    group = zarr.group(store=tmp_path / "image.zarr", path="image")
+    write_image(
+        image=image, group=group, name="image", element_format=CurrentRasterFormat(), storage_options=storage_options
+    )
+
+    for level, (_, array) in enumerate(sorted(group.arrays())):
+        assert array.chunks == (chunks[level] if per_level else (3, 8, 8))
+    read_image = _read_multiscale(
+        tmp_path / "image.zarr" / "image", raster_type="image", reader_format=get_ome_zarr_format(CurrentRasterFormat())
+    )
+    for scale in image:
+        assert np.array_equal(read_image[scale]["image"].values, image[scale]["image"].values)
+
+
+def test_write_raster_compressor_zarr_v2(tmp_path: Path, images: SpatialData) -> None:
+    # the compressor is only used by the Zarr v2 based raster formats
+    image = images["image2d_multiscale"]
+    group = zarr.group(store=tmp_path / "image.zarr", path="image", zarr_format=2)
+    write_image(image=image, group=group, name="image", element_format=RasterFormatV02(), compressor={"zstd": 3})
+
+    for scale in range(len(image)):
+        with open(tmp_path / "image.zarr" / "image" / str(scale) / ".zarray") as f:
+            compressor = json.load(f)["compressor"]
+        assert compressor["id"] == "blosc"
+        assert compressor["cname"] == "zstd"
+        assert compressor["clevel"] == 3
+        # bit-shuffle
+        assert compressor["shuffle"] == 2
+    read_image = _read_multiscale(
+        tmp_path / "image.zarr" / "image", raster_type="image", reader_format=get_ome_zarr_format(RasterFormatV02())
+    )
+    for scale in image:
+        assert np.array_equal(read_image[scale]["image"].values, image[scale]["image"].values)
+
+
 @pytest.mark.parametrize("sdata_container_format", SDATA_FORMATS)
 def test_self_contained(full_sdata: SpatialData, sdata_container_format: SpatialDataContainerFormatType) -> None:
     # data only in-memory, so the SpatialData object and all its elements are self-contained
@@ -963,3 +1036,23 @@ def test_can_read_sdata_with_reconsolidation(full_sdata, sdata_container_format:
 
         new_sdata = SpatialData.read(path, reconsolidate_metadata=True)
         assert_spatial_data_objects_are_identical(full_sdata, new_sdata)
+
+
+def test_repr_points_not_read_from_parquet_is_lazy() -> None:
+    from dask.callbacks import Callback
+
+    df = pd.DataFrame({"x": np.arange(10.0), "y": np.arange(10.0)})
+    points = PointsModel.parse(df)
+    sdata = SpatialData(points={"points": points[points["x"] > 4]})
+
+    n_computes = 0
+
+    class CountComputes(Callback):
+        def _start(self, dsk):
+            nonlocal n_computes
+            n_computes += 1
+
+    with CountComputes():
+        as_str = repr(sdata)
+    assert n_computes == 0
+    assert "with shape: (<Delayed>, 2)" in as_str
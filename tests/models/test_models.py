@@ -89,8 +89,11 @@ class TestModels:
             # no transformation in the element, but passed to the parser
             _set_transformations(element, {})
             t = Scale([1.0, 1.0], axes=("x", "y"))
-            parsed1 = model.parse(element, transformations={"global": t}, **kwargs)
+            transformations = {"global": t}
+            parsed1 = model.parse(element, transformations=transformations, **kwargs)
             assert get_transformation(parsed1, "global") == t
+            # the parsed element does not alias the mapping passed to the parser
+            assert get_transformation(parsed1, get_all=True) is not transformations
 
             # transformation in the element, but not passed to the parser
             _set_transformations(element, {})
@@ -195,6 +198,25 @@ class TestModels:
             with pytest.raises(ValueError):
                 model.parse(image, **kwargs)
 
+    @pytest.mark.parametrize("model", [Image2DModel, Labels2DModel, Labels3DModel, Image3DModel])
+    def test_raster_schema_transpose_dims(self, model: RasterSchema) -> None:
+        dims = list(reversed(model.dims.dims))
+        image = RNG.uniform(size=tuple(range(2, 2 + len(dims))))
+        spatial_image = model.parse(image, dims=dims)
+        assert spatial_image.dims == model.dims.dims
+        # numpy data is transposed before being wrapped, so no transpose layer is added to the Dask graph
+        assert len(spatial_image.data.dask.layers) == 1
+        np.testing.assert_array_equal(spatial_image.data.compute(), image.T)
+
+    @pytest.mark.parametrize("model", [Image2DModel, Labels2DModel, Labels3DModel, Image3DModel])
+    def test_raster_schema_transpose_dims_preserves_chunks(self, model: RasterSchema) -> None:
+        dims = list(reversed(model.dims.dims))
+        chunks = tuple(range(1, 1 + len(dims)))
+        image = from_array(RNG.uniform(size=tuple(range(2, 2 + len(dims)))), chunks=chunks)
+        spatial_image = model.parse(image, dims=dims)
+        # transposing a Dask array permutes the chunk grid, it does not merge chunks
+        assert spatial_image.data.chunksize == tuple(reversed(chunks))
+
     @pytest.mark.parametrize("model", [Labels2DModel, Labels3DModel])
     def test_labels_model_with_multiscales(self, model):
         # Passing "scale_factors" should generate multiscales with a "method" appropriate for labels
@@ -215,6 +237,16 @@ class TestModels:
         assert set(np.unique(image)) >= set(np.unique(actual.scale1.image)), (
             "Subsequent scales should not have interpolation artifacts"
         )
+        # the downscaled levels are lazily derived from the full resolution data
+        assert actual.scale0.image.data.name in actual.scale1.image.data.dask.layers
+
+    def test_raster_schema_validate_empty_multiscale(self) -> None:
+        with pytest.raises(ValueError, match="found no scales"):
+            Image2DModel().validate(DataTree())
+        image = Image2DModel.parse(RNG.uniform(size=(1, 4, 4)), dims=("c", "y", "x"), scale_factors=[2])
+        image["scale1"] = DataTree()
+        with pytest.raises(ValueError, match="found none in `scale1`"):
+            Image2DModel().validate(image)
 
     @pytest.mark.parametrize("model", [ShapesModel])
     @pytest.mark.parametrize("path", [POLYGON_PATH, MULTIPOLYGON_PATH, POINT_PATH])
@@ -412,6 +444,15 @@ class TestModels:
         del table.uns[TableModel.ATTRS_KEY]
         _ = TableModel.parse(table)
 
+    def test_table_model_region_column_converted_to_categorical(self) -> None:
+        obs = pd.DataFrame({"region": ["b", "a", "b", "a"], "instance_id": [0, 0, 1, 1]})
+        adata = AnnData(obs=obs)
+        with pytest.warns(UserWarning, match="to categorical dtype"):
+            table = TableModel.parse(adata, region=["b", "a"], region_key="region", instance_key="instance_id")
+        # the categories are inferred from the values, hence sorted
+        assert table.obs["region"].cat.categories.tolist() == ["a", "b"]
+        assert table.obs["region"].tolist() == ["b", "a", "b", "a"]
+
     @pytest.mark.parametrize(
         "name",
         [
@@ -452,6 +493,8 @@ class TestModels:
         adata = AnnData(RNG.normal(size=(10, 2)), obs=obs)
         with pytest.raises(ValueError, match=re.escape("Instance key column for region(s) `sample_1`")):
             model.parse(adata, region=region, region_key=region_key, instance_key="A")
+        # the metadata is only written when the table is valid
+        assert TableModel.ATTRS_KEY not in adata.uns
 
         adata.obs["A"] = [1] * 10
         with pytest.raises(
@@ -650,6 +693,11 @@ def test_force2d():
     assert_elements_are_identical(polygons_3d, expected_polygons_2d)
     assert_elements_are_identical(multipolygons_3d, expected_multipolygons_2d)
 
+    # already 2D data is left untouched
+    polygon = polygons_3d.geometry.iloc[0]
+    force_2d(polygons_3d)
+    assert polygons_3d.geometry.iloc[0] is polygon
+
 
 def test_dask_points_unsorted_index_with_warning(points):
     chunksize = 300
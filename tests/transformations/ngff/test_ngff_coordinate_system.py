@@ -199,3 +199,12 @@ def test_merge_coordinate_systems():
             NgffAxis("Z", "space", "micrometers"),
         ],
     )
+
+
+def test_copy_coordinate_system():
+    cs = NgffCoordinateSystem.from_dict(input_dict)
+    cs_copy = cs.copy()
+    assert cs_copy == cs
+    assert all(axis is not axis_copy for axis, axis_copy in zip(cs._axes, cs_copy._axes, strict=True))
+    cs_copy.set_unit("x", "meter")
+    assert cs.get_axis("x").unit == "micrometer"
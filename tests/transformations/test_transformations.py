@@ -63,6 +63,12 @@ def test_identity():
     )
     with pytest.raises(ValueError):
         Identity().to_affine_matrix(input_axes=("x", "y", "c"), output_axes=("x", "y"))
+    # the matrices are cached internally, the returned ones must be independent copies
+    m = Identity().to_affine_matrix(input_axes=("x", "y"), output_axes=("x", "y"))
+    m[0, -1] = 10
+    assert np.allclose(Identity().to_affine_matrix(input_axes=("x", "y"), output_axes=("x", "y")), np.eye(3))
+    assert np.allclose(Translation([1, 2], axes=("x", "y")).to_affine_matrix(("x", "y"), ("x", "y"))[:2, -1], [1, 2])
+    assert np.allclose(Identity().to_affine_matrix(input_axes=("x", "y"), output_axes=("x", "y")), np.eye(3))
 
 
 def test_map_axis():
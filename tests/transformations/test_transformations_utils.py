@@ -13,3 +13,15 @@ def test_convert_transformations_to_affine(full_sdata):
     for _, _, element in full_sdata.gen_spatial_elements():
         t = get_transformation(element, "test")
         assert isinstance(t, Affine)
+
+
+def test_set_transformation_does_not_alias_the_input_mapping(full_sdata):
+    elements = [element for _, _, element in full_sdata.gen_spatial_elements()]
+    transformations = {"global": Scale([2, 2], axes=("x", "y"))}
+    for element in elements:
+        set_transformation(element, transformations, set_all=True)
+    # modifying the input mapping, or the transformations of one element, must not affect the other elements
+    transformations["other"] = Translation([1, 2], axes=("x", "y"))
+    set_transformation(elements[0], Translation([3, 4], axes=("x", "y")), to_coordinate_system="test")
+    for element in elements[1:]:
+        assert set(get_transformation(element, get_all=True)) == {"global"}